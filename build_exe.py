@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import os
 import shutil
 import subprocess
+import sys
 from pathlib import Path
 
 
@@ -40,10 +42,11 @@ def parse_args() -> argparse.Namespace:
 
 
 def ensure_pyinstaller() -> None:
-    if shutil.which("pyinstaller"):
+    # PATH의 pyinstaller 스크립트 대신 현재 인터프리터에 설치된 모듈을 확인한다.
+    if importlib.util.find_spec("PyInstaller") is not None:
         return
     raise SystemExit(
-        "pyinstaller 명령을 찾을 수 없습니다. 'pip install pyinstaller' 로 설치한 뒤 다시 실행하세요."
+        "PyInstaller 모듈을 찾을 수 없습니다. 'pip install pyinstaller' 로 설치한 뒤 다시 실행하세요."
     )
 
 
@@ -64,7 +67,9 @@ def build_executable(entry: str, name: str, mode: str, clean: bool, windowed: bo
     mode_flag = "--onedir" if mode == "onedir" else "--onefile"
 
     cmd = [
-        "pyinstaller",
+        sys.executable,
+        "-m",
+        "PyInstaller",
         entry,
         mode_flag,
         "--name",
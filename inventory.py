@@ -10,17 +10,31 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import hashlib
 import json
 import os
+import queue
+import re
 import sys
+import tempfile
+import threading
 import time
 import shutil
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:  # pragma: no cover - optional dependency
+    import xxhash
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
 
 def _default_data_dir() -> Path:
     if sys.platform == "win32":
@@ -46,7 +60,32 @@ def _resolve_data_file() -> Path:
 DATA_FILE = _resolve_data_file()
 
 
-@dataclass
+def decode_json(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def encode_json(data: Any, *, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (compact by default, 2-space indent on request)."""
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _persistable(data: Dict) -> Dict:
+    """Drop runtime-only caches (keys starting with ``_``) before writing."""
+
+    return {key: value for key, value in data.items() if not key.startswith("_")}
+
+
+@dataclass(slots=True)
 class Transaction:
     type: str  # "in" or "out"
     artist: str
@@ -61,18 +100,30 @@ class Transaction:
     event: bool = False
     event_id: str = ""
     event_open: bool = False
+    _iso: str = field(init=False, repr=False, compare=False)
+    _period: str = field(init=False, repr=False, compare=False)
+    _day: str = field(init=False, repr=False, compare=False)
+    _year: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # 연/월/일 문자열은 ISO 표기의 앞부분이므로 한 번만 포맷한 뒤 잘라 쓴다.
+        iso = self.timestamp.isoformat()
+        self._iso = iso
+        self._year = iso[:4]
+        self._period = iso[:7]
+        self._day = iso[:10]
 
     @property
     def period(self) -> str:
-        return self.timestamp.strftime("%Y-%m")
+        return self._period
 
     @property
     def day(self) -> str:
-        return self.timestamp.date().isoformat()
+        return self._day
 
     @property
     def year(self) -> str:
-        return self.timestamp.strftime("%Y")
+        return self._year
 
     def to_dict(self) -> Dict[str, str]:
         return {
@@ -83,11 +134,11 @@ class Transaction:
             "option": self.option,
             "location": self.location,
             "quantity": self.quantity,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._iso,
             "actor": self.actor,
-            "period": self.period,
-            "day": self.day,
-            "year": self.year,
+            "period": self._period,
+            "day": self._day,
+            "year": self._year,
             "description": self.description,
             "event": self.event,
             "event_id": self.event_id,
@@ -95,7 +146,35 @@ class Transaction:
         }
 
 
+_INTERNED_HISTORY_FIELDS = ("type", "artist", "item", "category", "option", "location", "period", "day", "year")
+_INTERNED_METADATA_FIELDS = ("artist", "category", "option")
+
+
+def _intern_strings(data: Dict) -> None:
+    """Share one copy of the few distinct names repeated across history/metadata."""
+
+    intern = sys.intern
+    for entry in data.get("history", []):
+        for key in _INTERNED_HISTORY_FIELDS:
+            value = entry.get(key)
+            if type(value) is str:
+                entry[key] = intern(value)
+    for info in data.get("item_metadata", {}).values():
+        if not isinstance(info, dict):
+            continue
+        for key in _INTERNED_METADATA_FIELDS:
+            value = info.get(key)
+            if type(value) is str:
+                info[key] = intern(value)
+
+
 def load_data() -> Dict:
+    """Load the dataset from disk.
+
+    Every call parses the file again and returns a new dict, so unsaved edits
+    made to an earlier result never leak into a later load.
+    """
+
     def _empty() -> Dict:
         return {
             "current_period": None,
@@ -105,14 +184,14 @@ def load_data() -> Dict:
             "item_metadata": {},
             "last_updated": None,
             "activity_log": [],
+            "schema_version": SCHEMA_VERSION,
         }
 
     if not DATA_FILE.exists():
         return _empty()
 
     try:
-        with DATA_FILE.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = decode_json(DATA_FILE.read_bytes())
     except Exception as exc:  # pragma: no cover - startup recovery
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = DATA_FILE.with_suffix(f".corrupt_{timestamp}.json")
@@ -130,16 +209,62 @@ def load_data() -> Dict:
         return fresh
 
     _ensure_new_schema(data)
+    _intern_strings(data)
     data.setdefault("last_updated", None)
     return data
 
 
-def save_data(data: Dict, *, update_timestamp: bool = True) -> None:
+def atomic_write(path, payload: bytes) -> None:
+    """Write via a temp file + os.replace so readers never see a partial file.
+
+    Replacing (rather than rewriting in place) also keeps hard-linked backups
+    of the previous revision intact.
+    """
+
+    atomic_write_chunks(path, (payload,))
+
+
+def atomic_write_chunks(path, chunks: Iterable[bytes]) -> None:
+    """Like atomic_write, but streams ``chunks`` so the full payload never sits in memory."""
+
+    path = Path(path)
+    # 저장 큐 작업자와 복원 등 여러 스레드가 같은 파일을 쓸 수 있으므로 임시 파일 이름을 매번 새로 만든다.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def serialize_data(data: Dict, *, update_timestamp: bool = True) -> bytes:
+    """Encode the dataset exactly as save_data would write it."""
+
     if update_timestamp:
         data["last_updated"] = datetime.now().isoformat()
-    _write_backup(data)
-    with DATA_FILE.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    return encode_json(_persistable(data))
+
+
+def write_data_payload(payload: bytes) -> None:
+    """Persist bytes produced by :func:`serialize_data` as the active data file.
+
+    Lets callers serialize on one thread and do the disk I/O on another.
+    """
+
+    atomic_write(DATA_FILE, payload)
+    _write_backup(None, payload=payload, source=DATA_FILE)
+
+
+def save_data(data: Dict, *, update_timestamp: bool = True) -> None:
+    write_data_payload(serialize_data(data, update_timestamp=update_timestamp))
 
 
 def backup_data(data: Dict) -> None:
@@ -167,8 +292,7 @@ def restore_backup(path: str) -> Dict:
     backup_path = Path(path)
     if not backup_path.exists():
         raise FileNotFoundError(f"백업 파일을 찾을 수 없습니다: {backup_path}")
-    with backup_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = decode_json(backup_path.read_bytes())
 
     data.setdefault("current_period", None)
     data.setdefault("periods", {})
@@ -178,21 +302,93 @@ def restore_backup(path: str) -> Dict:
     data.setdefault("last_updated", None)
     _ensure_new_schema(data)
 
-    with DATA_FILE.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    atomic_write(DATA_FILE, encode_json(_persistable(data), indent=True))
 
     return data
 
 
 _LAST_BACKUP_MONO = 0.0
 _LAST_BACKUP_PATH: Optional[Path] = None
+_LAST_BACKUP_DIGESTS: Dict[str, tuple] = {}
+
 
+def _payload_digest(payload: bytes) -> object:
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(payload)
+    return hashlib.blake2b(payload, digest_size=16).digest()
 
-def _write_backup(data: Dict, *, label: Optional[str] = None, keep: int = 10, force: bool = False) -> Path:
+
+def _prune_backups(backup_dir: Path, pattern: str, keep: int) -> None:
+    backups = sorted(backup_dir.glob(pattern))
+    for old in backups[:-keep]:
+        old.unlink(missing_ok=True)
+
+
+class _BackupWriter:
+    """Background writer for serialized backup snapshots.
+
+    Every snapshot goes to its own timestamped file, so pending writes are
+    not coalesced. Queued writes are flushed at interpreter exit.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[tuple[Path, bytes, str, int]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # 아직 디스크에 쓰지 않은 백업 경로. 중복 확인에서 이미 있는 파일로 취급한다.
+        self._pending: "set[Path]" = set()
+
+    def submit(self, path: Path, payload: bytes, pattern: str, keep: int) -> None:
+        with self._lock:
+            self._pending.add(path)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+                self._worker.start()
+        self._queue.put((path, payload, pattern, keep))
+
+    def flush(self) -> None:
+        if self._worker is not None:
+            self._queue.join()
+
+    def is_pending(self, path: Path) -> bool:
+        with self._lock:
+            return path in self._pending
+
+    def _worker_loop(self) -> None:
+        while True:
+            path, payload, pattern, keep = self._queue.get()
+            try:
+                atomic_write(path, payload)
+                _prune_backups(path.parent, pattern, keep)
+            except Exception as exc:  # pragma: no cover - background logging only
+                print(f"[backup] 백업 저장 실패: {exc}", file=sys.stderr)
+            finally:
+                with self._lock:
+                    self._pending.discard(path)
+                self._queue.task_done()
+
+
+_BACKUP_WRITER = _BackupWriter()
+atexit.register(_BACKUP_WRITER.flush)
+
+
+def _write_backup(
+    data: Optional[Dict],
+    *,
+    label: Optional[str] = None,
+    keep: int = 10,
+    force: bool = False,
+    payload: Optional[bytes] = None,
+    source: Optional[Path] = None,
+) -> Path:
     """Persist a timestamped backup alongside the primary data file.
 
     The backup keeps recent revisions so schema-compatible files remain
-    available even after program updates.
+    available even after program updates. When ``source`` is a file that
+    already holds ``payload`` (the freshly written primary), it is
+    hard-linked (or copied where links are unsupported) instead of written
+    again. A payload identical to the last backup with the same label is
+    not stored twice; the existing backup path is returned instead.
     """
 
     backup_dir = DATA_FILE.parent / "backups"
@@ -202,17 +398,33 @@ def _write_backup(data: Dict, *, label: Optional[str] = None, keep: int = 10, fo
     if not force and _LAST_BACKUP_PATH is not None and now - _LAST_BACKUP_MONO < 120:
         return _LAST_BACKUP_PATH
 
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
     label_part = f"_{label}" if label else ""
-    backup_path = backup_dir / f"{DATA_FILE.stem}{label_part}_{timestamp}.json"
-    with backup_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    if payload is None:
+        payload = encode_json(_persistable(data))
+    digest = _payload_digest(payload)
+    previous = _LAST_BACKUP_DIGESTS.get(label_part)
+    # 직전 백업이 아직 백그라운드 쓰기 대기 중이면 파일이 없어도 있는 것으로 본다.
+    if (
+        previous is not None
+        and previous[0] == digest
+        and (_BACKUP_WRITER.is_pending(previous[1]) or previous[1].exists())
+    ):
+        return previous[1]
 
+    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    backup_path = backup_dir / f"{DATA_FILE.stem}{label_part}_{timestamp}.json"
     pattern = f"{DATA_FILE.stem}{label_part}_*.json"
-    backups = sorted(backup_dir.glob(pattern))
-    for old in backups[:-keep]:
-        old.unlink(missing_ok=True)
+    if source is not None:
+        try:
+            os.link(source, backup_path)
+        except OSError:
+            shutil.copyfile(source, backup_path)
+        _prune_backups(backup_dir, pattern, keep)
+    else:
+        # 스냅샷 직렬화만 호출한 쪽에서 하고, 쓰기/fsync/정리는 백그라운드에서 처리한다.
+        _BACKUP_WRITER.submit(backup_path, payload, pattern, keep)
 
+    _LAST_BACKUP_DIGESTS[label_part] = (digest, backup_path)
     _LAST_BACKUP_MONO = now
     _LAST_BACKUP_PATH = backup_path
     return backup_path
@@ -238,7 +450,6 @@ def normalize_category(value: Optional[str]) -> str:
 
 
 def ensure_period(data: Dict, period: str) -> None:
-    _ensure_new_schema(data)
     current = data.get("current_period")
     periods = data.setdefault("periods", {})
     if period in periods:
@@ -248,7 +459,7 @@ def ensure_period(data: Dict, period: str) -> None:
         return
     if current == period:
         return
-    stock_snapshot = deepcopy(data.get("stock", {}))
+    stock_snapshot = _clone_stock(data.get("stock", {}))
     periods[period] = {
         "opening_stock": stock_snapshot,
         "created_at": datetime.now().isoformat(),
@@ -256,10 +467,30 @@ def ensure_period(data: Dict, period: str) -> None:
     data["current_period"] = period
 
 
+def _clone_stock(stock: Dict) -> Dict:
+    """Copy a {item: {option: {location: qty}}} map without deepcopy overhead."""
+
+    return {
+        item: {option: dict(locations) for option, locations in option_map.items()}
+        for item, option_map in stock.items()
+    }
+
+
 def _option_key(option: str) -> str:
     return option or ""
 
 
+SCHEMA_VERSION = 2
+
+
+def _is_legacy_location_map(value: Dict) -> bool:
+    return bool(value) and all(isinstance(qty, int) for qty in value.values())
+
+
+def _is_legacy_option_map(value: object) -> bool:
+    return not isinstance(value, dict) or _is_legacy_location_map(value)
+
+
 def _ensure_new_schema(data: Dict) -> None:
     """Upgrade legacy stock layouts that lacked option separation.
 
@@ -267,23 +498,22 @@ def _ensure_new_schema(data: Dict) -> None:
     {item: {option: {location: qty}}} so 동일한 품목의 서로 다른 옵션이
     합산되지 않는다. This upgrader wraps legacy location maps under the
     empty-string option key.
+
+    Migrated data is tagged with ``schema_version`` so the walk runs once per
+    dataset (at load/restore time) instead of on every write. Bump
+    ``SCHEMA_VERSION`` whenever the layout changes so older files re-migrate.
     """
 
+    if data.get("schema_version") == SCHEMA_VERSION:
+        return
+
     stock = data.get("stock")
     if not isinstance(stock, dict):
-        data["stock"] = {}
-        return
-    changed = False
-    for item, value in list(stock.items()):
-        if not isinstance(value, dict):
-            stock[item] = {"": {}}
-            changed = True
-            continue
-        if value and all(isinstance(qty, int) for qty in value.values()):
-            stock[item] = {"": value}
-            changed = True
-    if changed:
-        data["stock"] = stock
+        stock = data["stock"] = {}
+    # 대부분 이미 새 구조이므로 레거시 항목이 있을 때만 목록을 만든다.
+    for item in [item for item, value in stock.items() if _is_legacy_option_map(value)]:
+        value = stock[item]
+        stock[item] = {"": value if isinstance(value, dict) else {}}
 
     metadata = data.setdefault("item_metadata", {})
     for info in metadata.values():
@@ -297,13 +527,8 @@ def _ensure_new_schema(data: Dict) -> None:
         if not isinstance(opening, dict):
             period_info["opening_stock"] = {}
             continue
-        migrated = False
-        for item, value in list(opening.items()):
-            if value and all(isinstance(qty, int) for qty in value.values()):
-                opening[item] = {"": value}
-                migrated = True
-        if migrated:
-            period_info["opening_stock"] = opening
+        for item in [item for item, value in opening.items() if _is_legacy_location_map(value)]:
+            opening[item] = {"": opening[item]}
 
     history = data.get("history", [])
     for entry in history:
@@ -316,20 +541,55 @@ def _ensure_new_schema(data: Dict) -> None:
         if isinstance(info, dict) and not info.get("category"):
             info["category"] = "album"
 
+    data["schema_version"] = SCHEMA_VERSION
+
 
 def update_stock(data: Dict, item: str, option: str, location: str, quantity: int) -> None:
-    data.setdefault("stock", {})
-    _ensure_new_schema(data)
-    option_map = data["stock"].setdefault(item, {})
-    locations = option_map.setdefault(_option_key(option), {})
+    stock = data.get("stock")
+    if stock is None:
+        stock = data["stock"] = {}
+    option_map = stock.get(item)
+    if option_map is None:
+        option_map = stock[item] = {}
+    option_key = sys.intern(_option_key(option))
+    locations = option_map.get(option_key)
+    if locations is None:
+        locations = option_map[option_key] = {}
     locations[location] = locations.get(location, 0) + quantity
+    totals = data.get("_item_totals")
+    if totals is not None:
+        totals[item] = totals.get(item, 0) + quantity
+
+
+def item_totals(data: Dict) -> Dict[str, int]:
+    """Return {item: total quantity}, kept under the runtime-only ``_item_totals`` key.
+
+    update_stock keeps the totals current; code that edits ``data["stock"]``
+    directly must call :func:`invalidate_item_totals`.
+    """
+
+    totals = data.get("_item_totals")
+    if totals is None:
+        totals = {
+            item: sum(sum(locations.values()) for locations in options.values())
+            for item, options in data.get("stock", {}).items()
+        }
+        data["_item_totals"] = totals
+    return totals
+
+
+def invalidate_item_totals(data: Dict) -> None:
+    data.pop("_item_totals", None)
 
 
 def record_transaction(data: Dict, transaction: Transaction, *, allow_negative: bool = False) -> None:
     ensure_period(data, transaction.period)
-    _ensure_new_schema(data)
-    metadata = data.setdefault("item_metadata", {})
-    info = metadata.setdefault(transaction.item, {})
+    metadata = data.get("item_metadata")
+    if metadata is None:
+        metadata = data["item_metadata"] = {}
+    info = metadata.get(transaction.item)
+    if info is None:
+        info = metadata[transaction.item] = {}
     existing_artist = info.get("artist")
     if existing_artist and existing_artist != transaction.artist:
         raise ValueError(
@@ -355,14 +615,72 @@ def record_transaction(data: Dict, transaction: Transaction, *, allow_negative:
     else:
         update_stock(data, transaction.item, transaction.option, transaction.location, transaction.quantity)
     entry = transaction.to_dict()
-    data.setdefault("history", []).append(entry)
+    history = data.setdefault("history", [])
+    history.append(entry)
+    index = data.get("_indexes")
+    if index is not None:
+        _index_entry(index, len(history) - 1, entry)
 
 
 def iter_history(data: Dict) -> Iterable[Dict]:
     return data.get("history", [])
 
 
-def filter_history(
+_HISTORY_INDEX_FIELDS = ("day", "period", "year", "artist")
+
+
+def _index_entry(index: Dict[str, Dict[str, List[int]]], position: int, entry: Dict) -> None:
+    for key in _HISTORY_INDEX_FIELDS:
+        index[key].setdefault(entry.get(key), []).append(position)
+
+
+def history_index(data: Dict) -> Dict[str, Dict[str, List[int]]]:
+    """Return {field: {value: [history positions]}} for day/period/year/artist.
+
+    The index is built on first use and kept under the runtime-only
+    ``_indexes`` key; record_transaction appends to it. Code that edits or
+    removes history entries in place must call :func:`invalidate_history_index`.
+    """
+
+    index = data.get("_indexes")
+    if index is None:
+        index = {key: {} for key in _HISTORY_INDEX_FIELDS}
+        for position, entry in enumerate(data.get("history", [])):
+            _index_entry(index, position, entry)
+        data["_indexes"] = index
+    return index
+
+
+def invalidate_history_index(data: Dict) -> None:
+    data.pop("_indexes", None)
+
+
+_ISO_DAY_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _day_bound(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    if _ISO_DAY_RE.fullmatch(value):
+        return value
+    return datetime.fromisoformat(value).date().isoformat()
+
+
+def _indexed_candidates(
+    history: Iterable[Dict], index: Dict[str, Dict[str, List[int]]], criteria: Dict[str, Optional[str]]
+) -> Iterable[Dict]:
+    matches = [index[key].get(value, []) for key, value in criteria.items() if value]
+    if not matches:
+        return history
+    matches.sort(key=len)
+    positions = set(matches[0])
+    for other in matches[1:]:
+        positions.intersection_update(other)
+    entries = history if isinstance(history, list) else list(history)
+    return [entries[position] for position in sorted(positions)]
+
+
+def _iter_filtered_history(
     history: Iterable[Dict],
     *,
     day: Optional[str] = None,
@@ -371,18 +689,19 @@ def filter_history(
     artist: Optional[str] = None,
     start_day: Optional[str] = None,
     end_day: Optional[str] = None,
-) -> List[Dict]:
-    filtered = []
-    start = datetime.fromisoformat(start_day).date() if start_day else None
-    end = datetime.fromisoformat(end_day).date() if end_day else None
+    index: Optional[Dict[str, Dict[str, List[int]]]] = None,
+) -> Iterable[Dict]:
+    if index is not None:
+        history = _indexed_candidates(
+            history, index, {"day": day, "period": month, "year": year, "artist": artist}
+        )
+    # ISO YYYY-MM-DD strings sort like dates, so bounds are compared as text.
+    start = _day_bound(start_day)
+    end = _day_bound(end_day)
     for entry in history:
-        entry_day_str = entry.get("day")
         if start or end:
-            if not entry_day_str:
-                continue
-            try:
-                entry_day = datetime.fromisoformat(entry_day_str).date()
-            except ValueError:
+            entry_day = entry.get("day")
+            if not entry_day:
                 continue
             if start and entry_day < start:
                 continue
@@ -396,53 +715,104 @@ def filter_history(
             continue
         if artist and entry.get("artist") != artist:
             continue
-        filtered.append(entry)
-    return filtered
+        yield entry
+
+
+def filter_history(
+    history: Iterable[Dict],
+    *,
+    day: Optional[str] = None,
+    month: Optional[str] = None,
+    year: Optional[str] = None,
+    artist: Optional[str] = None,
+    start_day: Optional[str] = None,
+    end_day: Optional[str] = None,
+    index: Optional[Dict[str, Dict[str, List[int]]]] = None,
+) -> List[Dict]:
+    return list(
+        _iter_filtered_history(
+            history,
+            day=day,
+            month=month,
+            year=year,
+            artist=artist,
+            start_day=start_day,
+            end_day=end_day,
+            index=index,
+        )
+    )
+
+
+def _add_to_summary(summary: Dict[str, Dict[str, Dict[str, int]]], entry: Dict) -> None:
+    option_map = summary.setdefault(entry["item"], {})
+    locations = option_map.setdefault(_option_key(entry.get("option", "")), {})
+    location = entry["location"]
+    sign = 1 if entry["type"] == "in" else -1
+    locations[location] = locations.get(location, 0) + sign * entry["quantity"]
 
 
 def summarize(entries: Iterable[Dict]) -> Dict[str, Dict[str, Dict[str, int]]]:
     summary: Dict[str, Dict[str, Dict[str, int]]] = {}
     for entry in entries:
-        item = entry["item"]
-        option = _option_key(entry.get("option", ""))
-        location = entry["location"]
-        sign = 1 if entry["type"] == "in" else -1
-        option_map = summary.setdefault(item, {})
-        locations = option_map.setdefault(option, {})
-        locations[location] = locations.get(location, 0) + sign * entry["quantity"]
+        _add_to_summary(summary, entry)
     return summary
 
 
+def filter_and_summarize(
+    history: Iterable[Dict], *, collect_entries: bool = True, **criteria: object
+) -> tuple:
+    """Filter (same keyword criteria as filter_history) and summarize in one pass.
+
+    Returns ``(entries, summary)``; ``entries`` is None when
+    ``collect_entries`` is False so summary-only callers skip the list.
+    """
+
+    entries: Optional[List[Dict]] = [] if collect_entries else None
+    summary: Dict[str, Dict[str, Dict[str, int]]] = {}
+    for entry in _iter_filtered_history(history, **criteria):
+        _add_to_summary(summary, entry)
+        if entries is not None:
+            entries.append(entry)
+    return entries, summary
+
+
 def format_stock_table(
     stock: Dict[str, Dict[str, Dict[str, int]]], *, metadata: Optional[Dict[str, Dict[str, str]]] = None, include_artist: bool = True
 ) -> str:
     rows = []
-    for item in sorted(stock):
-        for option in sorted(stock[item]):
-            for location in sorted(stock[item][option]):
-                artist = None
-                if metadata:
-                    artist = metadata.get(item, {}).get("artist")
-                rows.append((artist, item, option or "-", location, stock[item][option][location]))
+    for item, options in stock.items():
+        artist = metadata.get(item, {}).get("artist") if metadata else None
+        artist = artist or "-"
+        for option, locations in options.items():
+            option_label = option or "-"
+            for location, qty in locations.items():
+                rows.append((artist, item, option_label, location, qty, option))
     if not rows:
         return "(데이터 없음)"
-    item_width = max(len(r[1]) for r in rows)
-    opt_width = max(len(r[2]) for r in rows)
-    loc_width = max(len(r[3]) for r in rows)
+    # 원래 옵션 키로 정렬해야 빈 옵션("")이 "-" 표기와 무관하게 맨 앞에 온다.
+    rows.sort(key=lambda r: (r[1], r[5], r[3]))
+
+    artist_width = item_width = opt_width = loc_width = 0
+    for artist, item, option_label, location, _qty, _option in rows:
+        if len(artist) > artist_width:
+            artist_width = len(artist)
+        if len(item) > item_width:
+            item_width = len(item)
+        if len(option_label) > opt_width:
+            opt_width = len(option_label)
+        if len(location) > loc_width:
+            loc_width = len(location)
+
     if include_artist:
-        artist_width = max(len(r[0] or "-") for r in rows)
         header = f"{'아티스트':<{artist_width}}  {'품목':<{item_width}}  {'옵션':<{opt_width}}  {'로케이션':<{loc_width}}  수량"
+        line_format = f"{{:<{artist_width}}}  {{:<{item_width}}}  {{:<{opt_width}}}  {{:<{loc_width}}}  {{}}".format
+        lines = [header]
+        lines.extend(line_format(*row[:5]) for row in rows)
     else:
-        artist_width = 0
         header = f"{'품목':<{item_width}}  {'옵션':<{opt_width}}  {'로케이션':<{loc_width}}  수량"
-    lines = [header]
-    for artist, item, option, location, qty in rows:
-        if include_artist:
-            lines.append(
-                f"{(artist or '-'):<{artist_width}}  {item:<{item_width}}  {option:<{opt_width}}  {location:<{loc_width}}  {qty}"
-            )
-        else:
-            lines.append(f"{item:<{item_width}}  {option:<{opt_width}}  {location:<{loc_width}}  {qty}")
+        line_format = f"{{:<{item_width}}}  {{:<{opt_width}}}  {{:<{loc_width}}}  {{}}".format
+        lines = [header]
+        lines.extend(line_format(*row[1:5]) for row in rows)
     return "\n".join(lines)
 
 
@@ -457,13 +827,21 @@ def filter_stock_by_artist(
     return filtered
 
 
-def summarize_stock_by_artist(stock: Dict[str, Dict[str, Dict[str, int]]], metadata: Dict[str, Dict[str, str]]) -> Dict[str, int]:
+def summarize_stock_by_artist(
+    stock: Dict[str, Dict[str, Dict[str, int]]],
+    metadata: Dict[str, Dict[str, str]],
+    totals: Optional[Dict[str, int]] = None,
+) -> Dict[str, int]:
+    """Sum quantities per artist; ``totals`` (see item_totals) skips the per-location walk."""
+
     summary: Dict[str, int] = {}
     for item, options in stock.items():
         artist = metadata.get(item, {}).get("artist", "미분류")
-        summary.setdefault(artist, 0)
-        for locations in options.values():
-            summary[artist] += sum(locations.values())
+        if totals is not None:
+            quantity = totals.get(item, 0)
+        else:
+            quantity = sum(sum(locations.values()) for locations in options.values())
+        summary[artist] = summary.get(artist, 0) + quantity
     return summary
 
 
@@ -509,56 +887,67 @@ def determine_category(data: Dict, item: str, provided: Optional[str]) -> str:
     return category
 
 
-def export_to_xlsx(entries: List[Dict], path: str, *, include_summary: bool) -> None:
-    try:
+# (키, 머리글, 값이 없을 때 기본값). 기본값이 None인 열은 빈 셀로 남는다.
+_TRANSACTION_EXPORT_COLUMNS = (
+    ("type", "타입", None),
+    ("artist", "아티스트", None),
+    ("item", "품목", None),
+    ("category", "구분", ""),
+    ("option", "옵션", ""),
+    ("location", "로케이션", None),
+    ("quantity", "수량", None),
+    ("timestamp", "기록시각", None),
+    ("day", "일자", None),
+    ("period", "월", None),
+    ("year", "연", None),
+    ("description", "상세내용", ""),
+    ("actor", "작성자", ""),
+)
+
+
+_WORKBOOK_CLS = None
+
+
+def get_workbook_class():
+    """Return openpyxl's ``Workbook``, importing openpyxl on first use only.
+
+    Raises ImportError when openpyxl is not installed.
+    """
+    global _WORKBOOK_CLS
+    if _WORKBOOK_CLS is None:
         from openpyxl import Workbook
+
+        _WORKBOOK_CLS = Workbook
+    return _WORKBOOK_CLS
+
+
+def export_to_xlsx(
+    entries: List[Dict],
+    path: str,
+    *,
+    include_summary: bool,
+    summary: Optional[Dict[str, Dict[str, Dict[str, int]]]] = None,
+) -> None:
+    try:
+        Workbook = get_workbook_class()
     except ImportError as exc:
         raise RuntimeError("openpyxl 모듈이 필요합니다. 'pip install openpyxl' 로 설치해 주세요.") from exc
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Transactions"
-    headers = [
-        "타입",
-        "아티스트",
-        "품목",
-        "구분",
-        "옵션",
-        "로케이션",
-        "수량",
-        "기록시각",
-        "일자",
-        "월",
-        "연",
-        "상세내용",
-        "작성자",
-    ]
-    ws.append(headers)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Transactions")
+    ws.append([header for _key, header, _default in _TRANSACTION_EXPORT_COLUMNS])
+    columns = tuple((key, default) for key, _header, default in _TRANSACTION_EXPORT_COLUMNS)
     for entry in entries:
-        ws.append(
-            [
-                entry.get("type"),
-                entry.get("artist"),
-                entry.get("item"),
-                entry.get("category", ""),
-                entry.get("option", ""),
-                entry.get("location"),
-                entry.get("quantity"),
-                entry.get("timestamp"),
-                entry.get("day"),
-                entry.get("period"),
-                entry.get("year"),
-                entry.get("description", ""),
-                entry.get("actor", ""),
-            ]
-        )
+        ws.append([entry.get(key, default) for key, default in columns])
     if include_summary:
         ws2 = wb.create_sheet("Summary")
-        ws2.append(["품목", "로케이션", "수량"])
-        summary = summarize(entries)
-        for item, locations in summary.items():
-            for location, qty in locations.items():
-                ws2.append([item, location, qty])
+        ws2.append(["품목", "옵션", "로케이션", "수량"])
+        if summary is None:
+            summary = summarize(entries)
+        for item, options in summary.items():
+            for option, locations in options.items():
+                for location, qty in locations.items():
+                    ws2.append([item, option, location, qty])
     wb.save(path)
     print(f"엑셀 파일로 저장했습니다: {path}")
 
@@ -617,7 +1006,7 @@ def handle_stock(args: argparse.Namespace) -> None:
     print(format_stock_table(stock, metadata=metadata, include_artist=not args.artist))
     if args.group_by_artist:
         print("\n아티스트별 합계")
-        print(format_artist_summary(summarize_stock_by_artist(stock, metadata)))
+        print(format_artist_summary(summarize_stock_by_artist(stock, metadata, item_totals(data))))
     if args.opening:
         period = data.get("current_period")
         if not period:
@@ -630,11 +1019,12 @@ def handle_stock(args: argparse.Namespace) -> None:
 
 def handle_search(args: argparse.Namespace) -> None:
     data = load_data()
-    if not any([args.day, args.month, args.year, args.start_day, args.end_day]):
+    if not (args.day or args.month or args.year or args.start_day or args.end_day):
         print("검색 조건을 하나 이상 지정해 주세요 (--day/--month/--year 또는 --start-day/--end-day).")
         return
-    entries = filter_history(
+    entries, summary = filter_and_summarize(
         iter_history(data),
+        index=history_index(data),
         day=args.day,
         month=args.month,
         year=args.year,
@@ -656,9 +1046,9 @@ def handle_search(args: argparse.Namespace) -> None:
     print("\n".join(lines))
     if args.summary:
         print("\n요약")
-        print(format_stock_table(summarize(entries), metadata=data.get("item_metadata", {})))
+        print(format_stock_table(summary, metadata=data.get("item_metadata", {})))
     if args.export_xlsx:
-        export_to_xlsx(entries, args.export_xlsx, include_summary=args.summary)
+        export_to_xlsx(entries, args.export_xlsx, include_summary=args.summary, summary=summary)
 
 
 def handle_start_period(args: argparse.Namespace) -> None:
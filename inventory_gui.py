@@ -8,18 +8,22 @@ inventory.py와 동일한 JSON 파일을 공유합니다.
 from __future__ import annotations
 
 import calendar
-import json
+import itertools
 import os
-import queue
 import re
 import threading
 import traceback
 import tkinter as tk
-from copy import deepcopy
+from array import array
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from tkinter import filedialog, messagebox, simpledialog, ttk
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 try:  # pragma: no cover - optional dependency
     from PIL import Image, ImageTk
@@ -27,32 +31,63 @@ except Exception:  # pragma: no cover - optional dependency
     Image = None
     ImageTk = None
 
+try:  # pragma: no cover - optional dependency
+    import xlsxwriter
+except Exception:  # pragma: no cover - optional dependency
+    xlsxwriter = None
+
+try:  # pragma: no cover - optional dependency
+    import ijson
+except Exception:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:  # pragma: no cover - optional dependency
+    import msgspec
+except Exception:  # pragma: no cover - optional dependency
+    msgspec = None
+
 from inventory import (
     DATA_FILE,
     Transaction,
+    atomic_write,
+    atomic_write_chunks,
     backup_data,
     backup_data_with_label,
     determine_artist,
+    decode_json,
     determine_category,
+    encode_json,
     ensure_period,
     export_to_xlsx,
-    filter_stock_by_artist,
     format_stock_table,
+    get_workbook_class,
+    invalidate_history_index,
+    invalidate_item_totals,
     iter_history,
     load_data,
     normalize_category,
     record_transaction,
     restore_backup,
-    save_data,
+    serialize_data,
     summarize,
     update_stock,
+    write_data_payload,
 )
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 SETTINGS_FILE = os.path.join(BASE_DIR, "inventory_settings.json")
 FATAL_LOG = Path(BASE_DIR) / "fatal.log"
+# 사용자 활동 기록은 데이터 파일과 분리된 JSONL 파일에 한 줄씩 덧붙인다.
+ACTIVITY_LOG_FILE = DATA_FILE.with_name("inventory_activity.jsonl")
+ACTIVITY_LOG_LIMIT = 5000
 CATEGORY_LABELS = {"album": "앨범", "md": "MD"}
+CATEGORY_LABELS_REV = {label: code for code, label in CATEGORY_LABELS.items()}
+# 입력 검증용 정규식: 예외 없이 형식부터 확인한다.
+_INT_RE = re.compile(r"-?\d+")
+_DAY_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# 연도 없이 입력한 월/일: 11/20, 11.20, 11-20 (끝의 구분자는 허용)
+_MONTH_DAY_RE = re.compile(r"(\d{1,2})\s*[./-]+\s*(\d{1,2})\s*[./-]*")
 
 
 def apply_modern_styles(root: tk.Misc) -> None:
@@ -99,143 +134,524 @@ def _log_fatal(context: str, exc: Exception) -> None:  # pragma: no cover - star
 
 
 class AsyncSaveQueue:
-    """Background saver to keep UI interactions responsive during disk writes."""
+    """Background saver to keep UI interactions responsive during disk writes.
+
+    Data is serialized on the caller's thread, which doubles as the snapshot:
+    later edits to the live dict cannot leak into a pending write.
+    """
 
     def __init__(self) -> None:
-        self._queue: "queue.Queue[tuple[Dict, bool]]" = queue.Queue()
-        self._lock = threading.Lock()
+        # 대기 중인 저장은 항상 최신 스냅샷 하나만 유지한다.
+        self._latest: Optional[bytes] = None
+        self._latest_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
         self._worker = threading.Thread(target=self._worker_loop, daemon=True)
         self._worker.start()
 
     def enqueue(self, data: Dict, *, update_timestamp: bool = True) -> None:
-        self._queue.put((data, update_timestamp))
+        payload = serialize_data(data, update_timestamp=update_timestamp)
+        with self._latest_lock:
+            self._latest = payload
+        self._wake.set()
 
     def save_now(self, data: Dict, *, update_timestamp: bool = True) -> None:
-        snapshot = deepcopy(data)
-        with self._lock:
-            save_data(snapshot, update_timestamp=update_timestamp)
+        payload = serialize_data(data, update_timestamp=update_timestamp)
+        with self._write_lock:
+            # 이 저장이 대기 중인 스냅샷보다 최신이므로 워커가 덮어쓰지 않도록 비운다.
+            with self._latest_lock:
+                self._latest = None
+            write_data_payload(payload)
+
+    def stop(self) -> None:
+        """Stop the worker after it writes any pending snapshot."""
+
+        self._stopped = True
+        self._wake.set()
+        self._worker.join()
+
+    def _take_latest(self) -> Optional[bytes]:
+        with self._latest_lock:
+            payload, self._latest = self._latest, None
+        return payload
 
     def _worker_loop(self) -> None:
         while True:
-            data, update_timestamp = self._queue.get()
-            # Coalesce any pending requests to write only the latest snapshot.
-            try:
-                while True:
-                    data, update_timestamp = self._queue.get_nowait()
-            except queue.Empty:
-                pass
-            snapshot = deepcopy(data)
+            self._wake.wait()
+            self._wake.clear()
             try:
-                with self._lock:
-                    save_data(snapshot, update_timestamp=update_timestamp)
+                with self._write_lock:
+                    payload = self._take_latest()
+                    if payload is not None:
+                        write_data_payload(payload)
             except Exception as exc:  # pragma: no cover - background logging only
                 print(f"[AsyncSaveQueue] 저장 실패: {exc}")
+            if self._stopped:
+                return
+
+
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], object]] = {}
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _cached_file_value(path: str) -> Optional[object]:
+    """Return the value remembered for ``path`` if the file has not changed since."""
+
+    cached = _FILE_CACHE.get(path)
+    if cached is None:
+        return None
+    stamp = _file_stamp(path)
+    if stamp is None or stamp != cached[0]:
+        _FILE_CACHE.pop(path, None)
+        return None
+    return cached[1]
+
+
+def _remember_file_value(path: str, value: object, stamp: Optional[Tuple[int, int]] = None) -> None:
+    if stamp is None:
+        stamp = _file_stamp(path)
+    if stamp is None:
+        _FILE_CACHE.pop(path, None)
+    else:
+        _FILE_CACHE[path] = (stamp, value)
+
+
+_SETTINGS_DEFAULTS: Dict[str, object] = {
+    "password": "",
+    "lock_on_start": True,
+    "lock_on_idle": True,
+    "idle_minutes": 5,
+    "location_presets": [],
+    "google_enabled": False,
+    "google_sheet_id": "",
+    "google_credentials_path": "",
+    "nickname": "",
+    "nickname_password": "",
+}
+
+
+def _copy_settings(settings: Dict[str, object]) -> Dict[str, object]:
+    # 캐시에 든 dict와 프리셋 목록을 호출자가 고쳐도 캐시가 바뀌지 않도록 복사해서 넘긴다.
+    copied = dict(settings)
+    presets = copied.get("location_presets")
+    if isinstance(presets, list):
+        copied["location_presets"] = list(presets)
+    return copied
+
+
+def _merge_settings(loaded: Dict[str, object]) -> Dict[str, object]:
+    merged = _copy_settings(_SETTINGS_DEFAULTS)
+    for key, value in loaded.items():
+        if key == "location_presets":
+            merged[key] = list(value) if isinstance(value, list) else []
+        elif key in _SETTINGS_DEFAULTS:
+            merged[key] = value
+    return merged
 
 
 def load_settings() -> Dict[str, object]:
     """Load GUI settings such as lock preferences and password."""
 
-    defaults: Dict[str, object] = {
-        "password": "",
-        "lock_on_start": True,
-        "lock_on_idle": True,
-        "idle_minutes": 5,
-        "location_presets": [],
-        "google_enabled": False,
-        "google_sheet_id": "",
-        "google_credentials_path": "",
-        "nickname": "",
-        "nickname_password": "",
-    }
-    if not os.path.exists(SETTINGS_FILE):
-        return defaults
+    cached = _cached_file_value(SETTINGS_FILE)
+    if cached is not None:
+        return _copy_settings(cached)
     try:
-        with open(SETTINGS_FILE, "r", encoding="utf-8") as fp:
-            loaded = json.load(fp)
-        if isinstance(loaded, dict):
-            merged = defaults.copy()
-            for key, value in loaded.items():
-                if key == "location_presets":
-                    merged[key] = value if isinstance(value, list) else []
-                elif key in defaults:
-                    merged[key] = value
-            return merged
-    except Exception:
-        return defaults
-    return defaults
+        with open(SETTINGS_FILE, "rb") as fp:
+            stat = os.fstat(fp.fileno())
+            loaded = decode_json(fp.read())
+    except FileNotFoundError:
+        return _copy_settings(_SETTINGS_DEFAULTS)
+    except Exception:  # 손상된 설정 파일
+        return _copy_settings(_SETTINGS_DEFAULTS)
+    if isinstance(loaded, dict):
+        merged = _merge_settings(loaded)
+        _remember_file_value(SETTINGS_FILE, merged, (stat.st_mtime_ns, stat.st_size))
+        return _copy_settings(merged)
+    return _copy_settings(_SETTINGS_DEFAULTS)
+
+
+_SETTINGS: Optional[Dict[str, object]] = None
+
+
+def get_settings() -> Dict[str, object]:
+    """Return the shared settings dict, loading it from disk on first use."""
+
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = load_settings()
+    return _SETTINGS
 
 
 def save_settings(settings: Dict[str, object]) -> None:
     """Persist GUI settings to disk."""
 
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as fp:
-        json.dump(settings, fp, ensure_ascii=False, indent=2)
+    global _SETTINGS
+    atomic_write(SETTINGS_FILE, encode_json(settings, indent=True))
+    # 다음 load_settings가 읽을 값과 같도록 기본값을 채운 사본을 캐시에 둔다.
+    _remember_file_value(SETTINGS_FILE, _merge_settings(settings))
+    _SETTINGS = settings
+
+
+def tail_lines(path, limit: int, *, block_size: int = 64 * 1024) -> List[bytes]:
+    """Return the last ``limit`` non-empty lines of ``path``, reading backwards from the end."""
+
+    if limit <= 0:
+        return []
+    try:
+        fp = open(path, "rb")
+    except FileNotFoundError:
+        return []
+    lines: List[bytes] = []
+    head = b""
+    with fp:
+        pos = fp.seek(0, os.SEEK_END)
+        # 빈 줄을 뺀 온전한 줄이 limit개가 될 때까지만 뒤에서부터 블록 단위로 읽는다.
+        while pos > 0 and len(lines) < limit:
+            step = min(block_size, pos)
+            pos -= step
+            fp.seek(pos)
+            parts = (fp.read(step) + head).split(b"\n")
+            # 맨 앞 조각은 앞 블록에 이어지는 줄의 일부일 수 있으므로 다음 블록과 합칠 때까지 남겨 둔다.
+            head = parts[0]
+            lines[:0] = [line for line in parts[1:] if line.strip()]
+    if pos == 0 and head.strip():
+        lines.insert(0, head)
+    return lines[-limit:]
+
+
+def count_lines(path, *, block_size: int = 1024 * 1024) -> int:
+    """Return the number of newline-terminated lines in ``path`` (0 when missing)."""
+
+    count = 0
+    try:
+        with open(path, "rb") as fp:
+            for block in iter(lambda: fp.read(block_size), b""):
+                count += block.count(b"\n")
+    except FileNotFoundError:
+        return 0
+    return count
+
+
+def load_activity_log(path=None, limit: int = ACTIVITY_LOG_LIMIT) -> "deque[Dict[str, str]]":
+    """Load the most recent activity entries into a bounded deque."""
+
+    entries: "deque[Dict[str, str]]" = deque(maxlen=limit)
+    for line in tail_lines(path or ACTIVITY_LOG_FILE, limit):
+        try:
+            entry = decode_json(line)
+        except Exception:  # 잘린 줄 등 손상된 항목은 건너뛴다.
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
+
+
+STOCK_EXPORT_HEADERS = (
+    "구분",
+    "아티스트",
+    "앨범/버전",
+    "옵션",
+    "기초재고",
+    "입고합계",
+    "출고합계",
+    "현재고",
+    "마지막 실사",
+    "로케이션",
+)
+LOCATION_EXPORT_HEADERS = ("구분", "아티스트", "앨범/버전", "옵션", "로케이션", "수량")
+
+
+def _iter_row_tuples(rows) -> Iterable[Tuple]:
+    """Yield plain tuples from a row sequence or a DataFrame-like object."""
+
+    # pandas를 직접 의존하지 않고 itertuples가 있으면 DataFrame으로 취급한다.
+    itertuples = getattr(rows, "itertuples", None)
+    if itertuples is not None:
+        return itertuples(index=False, name=None)
+    return rows
 
 
 def export_stock_rows_to_xlsx(
-    rows: List[Tuple[str, str, str, str, int, int, int, int, str, str]],
-    per_locations: List[Tuple[str, str, str, str, str, int]],
+    rows: Iterable[Tuple[str, str, str, str, int, int, int, int, str, str]],
+    per_locations: Iterable[Tuple[str, str, str, str, str, int]],
     path: str,
 ) -> None:
-    """Save current stock rows with opening/in/out/current metrics to Excel, plus per-location details."""
+    """Save current stock rows with opening/in/out/current metrics to Excel, plus per-location details.
+
+    ``rows``/``per_locations`` may be any iterable of tuples or a DataFrame in the header column order.
+    """
+
+    rows = _iter_row_tuples(rows)
+    per_locations = _iter_row_tuples(per_locations)
+    if xlsxwriter is not None:
+        _export_stock_rows_with_xlsxwriter(rows, per_locations, path)
+        return
 
     try:
-        from openpyxl import Workbook
+        Workbook = get_workbook_class()
     except ImportError as exc:
-        raise RuntimeError("openpyxl 모듈이 필요합니다. 'pip install openpyxl' 로 설치해 주세요.") from exc
-
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "CurrentStock"
-    ws.append(
-        [
-            "구분",
-            "아티스트",
-            "앨범/버전",
-            "옵션",
-            "기초재고",
-            "입고합계",
-            "출고합계",
-            "현재고",
-            "마지막 실사",
-            "로케이션",
-        ]
-    )
+        raise RuntimeError(
+            "openpyxl 또는 xlsxwriter 모듈이 필요합니다. 'pip install openpyxl' 로 설치해 주세요."
+        ) from exc
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("CurrentStock")
+    # write-only 시트의 append는 튜플을 그대로 받으므로 행마다 리스트를 만들지 않는다.
+    ws.append(STOCK_EXPORT_HEADERS)
+    append = ws.append
     for row in rows:
-        ws.append(list(row))
+        append(row)
 
     detail = wb.create_sheet("Locations")
-    detail.append(["구분", "아티스트", "앨범/버전", "옵션", "로케이션", "수량"])
-    for category, artist, item, option, location, qty in per_locations:
-        detail.append([category, artist, item, option, location, qty])
+    detail.append(LOCATION_EXPORT_HEADERS)
+    append = detail.append
+    for row in per_locations:
+        append(row)
     wb.save(path)
 
 
+def export_stock_rows_to_xlsx_async(
+    widget: tk.Misc,
+    rows: Iterable[Tuple[str, str, str, str, int, int, int, int, str, str]],
+    per_locations: Iterable[Tuple[str, str, str, str, str, int]],
+    path: str,
+    on_done,
+    *,
+    poll_ms: int = 100,
+) -> None:
+    """Write the stock workbook on a worker thread and call ``on_done(exc)`` on the Tk thread.
+
+    ``exc`` is None on success. Tk is only touched from the main loop: the worker
+    just records its outcome and ``widget.after`` polls for it.
+    """
+
+    outcome: List[Optional[Exception]] = []
+
+    def _work() -> None:
+        try:
+            export_stock_rows_to_xlsx(rows, per_locations, path)
+        except Exception as exc:  # pragma: no cover - file I/O
+            outcome.append(exc)
+        else:
+            outcome.append(None)
+
+    worker = threading.Thread(target=_work, name="stock-export", daemon=True)
+
+    def _poll() -> None:
+        if worker.is_alive() or not outcome:
+            widget.after(poll_ms, _poll)
+            return
+        on_done(outcome[0])
+
+    worker.start()
+    widget.after(poll_ms, _poll)
+
+
+def _export_stock_rows_with_xlsxwriter(
+    rows: Iterable[Tuple[str, str, str, str, int, int, int, int, str, str]],
+    per_locations: Iterable[Tuple[str, str, str, str, str, int]],
+    path: str,
+) -> None:
+    # 값만 쓰는 시트이므로 constant_memory 모드로 행마다 바로 디스크에 내보낸다.
+    wb = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_numbers": False})
+    try:
+        for name, headers, sheet_rows in (
+            ("CurrentStock", STOCK_EXPORT_HEADERS, rows),
+            ("Locations", LOCATION_EXPORT_HEADERS, per_locations),
+        ):
+            ws = wb.add_worksheet(name)
+            ws.write_row(0, 0, headers)
+            for row_index, row in enumerate(sheet_rows, start=1):
+                ws.write_row(row_index, 0, row)
+    finally:
+        wb.close()
+
+
 LOCATION_MAP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locations.json")
 
+if msgspec is not None:  # pragma: no cover - optional dependency
+
+    # 관대한 경로(_normalize_location_entry)와 같은 dict가 나오도록 맞춘다:
+    # 없는 키는 만들지 않고(UNSET), 모르는 키가 있으면 검증 실패로 관대한 경로에 넘겨 그대로 보존한다.
+    class LocationEntry(msgspec.Struct, forbid_unknown_fields=True):
+        map: Union[str, msgspec.UnsetType] = msgspec.UNSET
+        location: Union[str, msgspec.UnsetType] = msgspec.UNSET
+        rect: Union[Tuple[int, int, int, int], msgspec.UnsetType] = msgspec.UNSET
+
+    # strict=False: 예전 파일에 남아 있는 100.0 같은 정수형 실수도 int로 받아 준다.
+    _LOCATION_DECODER = msgspec.json.Decoder(List[LocationEntry], strict=False)
+else:
+    _LOCATION_DECODER = None
+
+
+def _normalize_location_entry(entry: Dict) -> Dict:
+    """Coerce ``rect`` to four ints in place; an unusable rect becomes ``[]``."""
+
+    rect = entry.get("rect")
+    try:
+        entry["rect"] = [int(rect[0]), int(rect[1]), int(rect[2]), int(rect[3])] if len(rect) == 4 else []
+    except (TypeError, ValueError):
+        entry["rect"] = []
+    return entry
+
+
+def _decode_location_entries(raw: bytes) -> List[Dict]:
+    if _LOCATION_DECODER is not None:
+        try:
+            # 파싱과 스키마 검증/정수 변환을 한 번의 C 패스로 끝낸다.
+            entries = msgspec.to_builtins(_LOCATION_DECODER.decode(raw))
+        except msgspec.ValidationError:
+            pass  # 스키마에 맞지 않는 엔트리가 섞여 있으면 아래의 관대한 경로로 읽는다.
+        else:
+            for entry in entries:
+                # 관대한 경로처럼 rect는 목록으로, 없으면 빈 목록으로 맞춘다.
+                rect = entry.get("rect")
+                entry["rect"] = list(rect) if rect is not None else []
+            return entries
+    data = decode_json(raw)
+    if not isinstance(data, list):
+        return []
+    return [_normalize_location_entry(entry) for entry in data if isinstance(entry, dict)]
+
+
+def _copy_location_entry(entry: Dict) -> Dict:
+    copied = dict(entry)
+    rect = copied.get("rect")
+    if isinstance(rect, list):
+        copied["rect"] = list(rect)
+    return copied
+
 
 def load_location_entries(path: Optional[str] = None) -> List[Dict]:
     """Load map entries from locations.json (if present)."""
 
     path = path or LOCATION_MAP_FILE
-    if not os.path.exists(path):
-        return []
+    cached = _cached_file_value(path)
+    if cached is not None:
+        # 캐시된 엔트리를 호출자가 고쳐도 캐시가 바뀌지 않도록 사본을 넘긴다.
+        return [_copy_location_entry(entry) for entry in cached]
+    # 존재 여부를 따로 확인하지 않고 바로 열어 본다(EAFP).
     try:
-        with open(path, "r", encoding="utf-8") as fp:
-            data = json.load(fp)
-        if isinstance(data, list):
-            return [entry for entry in data if isinstance(entry, dict)]
-    except Exception:
+        with open(path, "rb") as fp:
+            stat = os.fstat(fp.fileno())
+            entries = _decode_location_entries(fp.read())
+    except FileNotFoundError:
+        return []
+    except Exception:  # 손상된 JSON
         return []
-    return []
+    _remember_file_value(path, entries, (stat.st_mtime_ns, stat.st_size))
+    return [_copy_location_entry(entry) for entry in entries]
+
+
+def location_map_names(path: Optional[str] = None) -> Set[str]:
+    """Return the distinct map names in locations.json ("" for entries without one)."""
+
+    path = path or LOCATION_MAP_FILE
+    cached = _cached_file_value(path)
+    if cached is not None or ijson is None:
+        entries = cached if cached is not None else load_location_entries(path)
+        return {entry.get("map") or "" for entry in entries}
+    # ijson 이벤트만 훑어서 map 값을 모으므로 엔트리 dict를 만들지 않는다.
+    names: Set[str] = set()
+    try:
+        with open(path, "rb") as fp:
+            has_map = False
+            for prefix, event, value in ijson.parse(fp):
+                if prefix == "item" and event == "start_map":
+                    has_map = False
+                elif prefix == "item.map":
+                    has_map = True
+                    names.add(value or "")
+                elif prefix == "item" and event == "end_map" and not has_map:
+                    names.add("")
+    except FileNotFoundError:
+        return set()
+    except Exception:  # 손상된 JSON
+        return names
+    return names
+
+
+def iter_location_entries(path: Optional[str] = None, map_name: Optional[str] = None) -> Iterator[Dict]:
+    """Yield map entries, keeping only ``map_name``'s when given.
+
+    With ijson installed an uncached file is streamed one entry at a time, so
+    entries of other maps are never kept in memory.
+    """
+
+    path = path or LOCATION_MAP_FILE
+    cached = _cached_file_value(path)
+    if cached is not None:
+        for entry in cached:
+            if map_name is None or (entry.get("map") or "") == map_name:
+                yield _copy_location_entry(entry)
+        return
+    if ijson is None:
+        for entry in load_location_entries(path):
+            if map_name is None or (entry.get("map") or "") == map_name:
+                yield entry
+        return
+    try:
+        with open(path, "rb") as fp:
+            for entry in ijson.items(fp, "item", use_float=True):
+                if not isinstance(entry, dict):
+                    continue
+                if map_name is None or (entry.get("map") or "") == map_name:
+                    yield _normalize_location_entry(entry)
+    except FileNotFoundError:
+        return
+    except Exception:  # 손상된 JSON은 읽은 데까지만 사용
+        return
 
 
-def save_location_entries(entries: List[Dict], path: Optional[str] = None) -> None:
-    """Persist map entries to locations.json with UTF-8 encoding."""
+def _location_json_chunks(entries: Iterable[Dict]) -> Iterator[bytes]:
+    # 한 줄에 엔트리 하나씩 써서 전체 JSON 문자열을 메모리에 만들지 않는다.
+    yield b"["
+    sep = b"\n  "
+    for entry in entries:
+        yield sep
+        yield encode_json(entry)
+        sep = b",\n  "
+    yield b"\n]\n"
+
+
+def save_location_entries(entries: Iterable[Dict], path: Optional[str] = None) -> None:
+    """Persist map entries to locations.json with UTF-8 encoding.
+
+    ``entries`` may be a generator; it is serialized one entry at a time.
+    """
 
     path = path or LOCATION_MAP_FILE
-    with open(path, "w", encoding="utf-8") as fp:
-        json.dump(entries, fp, ensure_ascii=False, indent=2)
+    atomic_write_chunks(path, _location_json_chunks(entries))
+    _FILE_CACHE.pop(path, None)
+
+
+_MONTH_CALENDAR = calendar.Calendar(firstweekday=0)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> Optional[date]:
+    """Parse an ISO date/datetime string to a date (None if malformed); repeated strings hit the cache."""
+
+    try:
+        # 실사 기록은 date.isoformat()으로 저장되므로 대부분 날짜만 있는 10자 문자열이다.
+        if len(value) == 10:
+            return date.fromisoformat(value)
+        return datetime.fromisoformat(value).date()
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=512)
+def _month_matrix(year: int, month: int) -> Tuple[Tuple[int, ...], ...]:
+    return tuple(tuple(week) for week in _MONTH_CALENDAR.monthdayscalendar(year, month))
 
 
 class CalendarPopup(tk.Toplevel):
@@ -263,28 +679,37 @@ class CalendarPopup(tk.Toplevel):
 
         self.days_frame = ttk.Frame(self, padding=(12, 4, 12, 12))
         self.days_frame.pack()
-
-    def _render_days(self) -> None:
-        for child in self.days_frame.winfo_children():
-            child.destroy()
-        month_name = f"{self.current_year}년 {self.current_month:02d}월"
-        self.month_label.config(text=month_name)
-        headers = ["월", "화", "수", "목", "금", "토", "일"]
-        for idx, name in enumerate(headers):
+        for idx, name in enumerate(["월", "화", "수", "목", "금", "토", "일"]):
             ttk.Label(self.days_frame, text=name, width=4, anchor=tk.CENTER).grid(row=0, column=idx, pady=2)
-        cal = calendar.Calendar(firstweekday=0)
-        for row_idx, week in enumerate(cal.monthdayscalendar(self.current_year, self.current_month), start=1):
-            for col_idx, day in enumerate(week):
-                if day == 0:
-                    ttk.Label(self.days_frame, text="", width=4).grid(row=row_idx, column=col_idx, padx=2, pady=2)
-                    continue
+        # 6주 x 7일 버튼을 한 번만 만들고 월 이동 시에는 텍스트/표시 여부만 바꾼다.
+        self._cell_days = [[0] * 7 for _ in range(6)]
+        self._day_buttons: List[List[ttk.Button]] = []
+        for row_idx in range(6):
+            row_buttons = []
+            for col_idx in range(7):
                 btn = ttk.Button(
                     self.days_frame,
-                    text=f"{day:02d}",
                     width=4,
-                    command=lambda d=day: self._select_day(d),
+                    command=lambda r=row_idx, c=col_idx: self._select_day(self._cell_days[r][c]),
                 )
-                btn.grid(row=row_idx, column=col_idx, padx=2, pady=2)
+                btn.grid(row=row_idx + 1, column=col_idx, padx=2, pady=2)
+                row_buttons.append(btn)
+            self._day_buttons.append(row_buttons)
+
+    def _render_days(self) -> None:
+        month_name = f"{self.current_year}년 {self.current_month:02d}월"
+        self.month_label.config(text=month_name)
+        weeks = _month_matrix(self.current_year, self.current_month)
+        for row_idx, row_buttons in enumerate(self._day_buttons):
+            week = weeks[row_idx] if row_idx < len(weeks) else (0,) * 7
+            for col_idx, btn in enumerate(row_buttons):
+                day = week[col_idx]
+                self._cell_days[row_idx][col_idx] = day
+                if day == 0:
+                    btn.grid_remove()
+                else:
+                    btn.configure(text=f"{day:02d}")
+                    btn.grid()
 
     def _select_day(self, day: int) -> None:
         chosen = date(self.current_year, self.current_month, day)
@@ -308,6 +733,13 @@ class CalendarPopup(tk.Toplevel):
         self._render_days()
 
 
+def _prefilled_entry(parent: tk.Misc, value: str, *, width: int) -> ttk.Entry:
+    entry = ttk.Entry(parent, width=width)
+    if value:
+        entry.insert(0, value)
+    return entry
+
+
 class StockEditDialog(tk.Toplevel):
     def __init__(self, master: tk.Misc, *, item: str, location: str, quantity: int, artist: str, option: str, category: str):
         super().__init__(master)
@@ -320,31 +752,31 @@ class StockEditDialog(tk.Toplevel):
         body = ttk.Frame(self, padding=12)
         body.pack(fill=tk.BOTH, expand=True)
 
+        # 값은 저장할 때 한 번만 읽으므로 StringVar 없이 위젯에서 바로 가져온다.
         ttk.Label(body, text="품목").grid(row=0, column=0, sticky=tk.W)
-        self.item_var = tk.StringVar(value=item)
-        ttk.Entry(body, textvariable=self.item_var, width=30).grid(row=0, column=1, sticky=tk.W)
+        self.item_entry = _prefilled_entry(body, item, width=30)
+        self.item_entry.grid(row=0, column=1, sticky=tk.W)
 
         ttk.Label(body, text="아티스트").grid(row=1, column=0, sticky=tk.W, pady=(8, 0))
-        self.artist_var = tk.StringVar(value=artist if artist != "-" else "")
-        ttk.Entry(body, textvariable=self.artist_var, width=30).grid(row=1, column=1, sticky=tk.W, pady=(8, 0))
+        self.artist_entry = _prefilled_entry(body, artist if artist != "-" else "", width=30)
+        self.artist_entry.grid(row=1, column=1, sticky=tk.W, pady=(8, 0))
 
         ttk.Label(body, text="구분").grid(row=2, column=0, sticky=tk.W, pady=(8, 0))
-        self.category_var = tk.StringVar(value=CATEGORY_LABELS.get(category, category))
-        ttk.Combobox(body, textvariable=self.category_var, values=list(CATEGORY_LABELS.values()), state="readonly", width=12).grid(
-            row=2, column=1, sticky=tk.W, pady=(8, 0)
-        )
+        self.category_box = ttk.Combobox(body, values=list(CATEGORY_LABELS.values()), state="readonly", width=12)
+        self.category_box.set(CATEGORY_LABELS.get(category, category))
+        self.category_box.grid(row=2, column=1, sticky=tk.W, pady=(8, 0))
 
         ttk.Label(body, text="옵션").grid(row=3, column=0, sticky=tk.W, pady=(8, 0))
-        self.option_var = tk.StringVar(value=option if option != "-" else "")
-        ttk.Entry(body, textvariable=self.option_var, width=30).grid(row=3, column=1, sticky=tk.W, pady=(8, 0))
+        self.option_entry = _prefilled_entry(body, option if option != "-" else "", width=30)
+        self.option_entry.grid(row=3, column=1, sticky=tk.W, pady=(8, 0))
 
         ttk.Label(body, text="로케이션").grid(row=4, column=0, sticky=tk.W, pady=(8, 0))
-        self.location_var = tk.StringVar(value=location)
-        ttk.Entry(body, textvariable=self.location_var, width=30).grid(row=4, column=1, sticky=tk.W, pady=(8, 0))
+        self.location_entry = _prefilled_entry(body, location, width=30)
+        self.location_entry.grid(row=4, column=1, sticky=tk.W, pady=(8, 0))
 
         ttk.Label(body, text="수량").grid(row=5, column=0, sticky=tk.W, pady=(8, 0))
-        self.quantity_var = tk.StringVar(value=str(quantity))
-        ttk.Entry(body, textvariable=self.quantity_var, width=15).grid(row=5, column=1, sticky=tk.W, pady=(8, 0))
+        self.quantity_entry = _prefilled_entry(body, str(quantity), width=15)
+        self.quantity_entry.grid(row=5, column=1, sticky=tk.W, pady=(8, 0))
 
         btns = ttk.Frame(self, padding=(12, 0, 12, 12))
         btns.pack(fill=tk.X)
@@ -352,17 +784,17 @@ class StockEditDialog(tk.Toplevel):
         ttk.Button(btns, text="저장", command=self._save).pack(side=tk.RIGHT, padx=(0, 8))
 
     def _save(self) -> None:
-        try:
-            qty = int(self.quantity_var.get().strip())
-        except ValueError:
+        qty_text = self.quantity_entry.get().strip()
+        if not _INT_RE.fullmatch(qty_text):
             messagebox.showerror("오류", "수량은 정수여야 합니다.")
             return
-        location = self.location_var.get().strip()
+        qty = int(qty_text)
+        location = self.location_entry.get().strip()
         if not location:
             messagebox.showerror("오류", "로케이션을 입력해 주세요.")
             return
-        artist = self.artist_var.get().strip()
-        item = self.item_var.get().strip()
+        artist = self.artist_entry.get().strip()
+        item = self.item_entry.get().strip()
         if not artist:
             messagebox.showerror("오류", "아티스트를 입력해 주세요.")
             return
@@ -372,8 +804,8 @@ class StockEditDialog(tk.Toplevel):
         self.result = {
             "item": item,
             "artist": artist,
-            "category": self.category_var.get(),
-            "option": self.option_var.get().strip(),
+            "category": CATEGORY_LABELS_REV.get(self.category_box.get(), self.category_box.get()),
+            "option": self.option_entry.get().strip(),
             "location": location,
             "quantity": qty,
         }
@@ -391,36 +823,42 @@ class TransactionEditDialog(tk.Toplevel):
         body = ttk.Frame(self, padding=12)
         body.pack(fill=tk.BOTH, expand=True)
 
-        self.artist_var = tk.StringVar(value=entry.get("artist", ""))
-        self.item_var = tk.StringVar(value=entry.get("item", ""))
-        self.option_var = tk.StringVar(value=entry.get("option", ""))
-        self.category_var = tk.StringVar(value=CATEGORY_LABELS.get(entry.get("category", "album"), entry.get("category", "")))
-        self.location_var = tk.StringVar(value=entry.get("location", ""))
-        self.quantity_var = tk.StringVar(value=str(entry.get("quantity", 1)))
-        self.day_var = tk.StringVar(value=entry.get("day") or date.today().isoformat())
-        self.desc_var = tk.StringVar(value=entry.get("description", ""))
         self.require_description = require_description
 
-        labels = [
-            ("아티스트", self.artist_var, 24),
-            ("앨범/버전", self.item_var, 26),
-            ("옵션", self.option_var, 20),
-            ("구분", self.category_var, 16),
-            ("로케이션", self.location_var, 20),
-            ("수량", self.quantity_var, 10),
+        fields = [
+            ("아티스트", entry.get("artist", ""), 24),
+            ("앨범/버전", entry.get("item", ""), 26),
+            ("옵션", entry.get("option", ""), 20),
+            ("구분", CATEGORY_LABELS.get(entry.get("category", "album"), entry.get("category", "")), 16),
+            ("로케이션", entry.get("location", ""), 20),
+            ("수량", str(entry.get("quantity", 1)), 10),
         ]
-        for idx, (title, var, width) in enumerate(labels):
+        widgets: List[ttk.Entry] = []
+        for idx, (title, value, width) in enumerate(fields):
             ttk.Label(body, text=title).grid(row=idx, column=0, sticky=tk.W, pady=(0 if idx == 0 else 6, 0))
-            ttk.Entry(body, textvariable=var, width=width).grid(row=idx, column=1, sticky=tk.W, pady=(0 if idx == 0 else 6, 0))
+            widget = _prefilled_entry(body, value, width=width)
+            widget.grid(row=idx, column=1, sticky=tk.W, pady=(0 if idx == 0 else 6, 0))
+            widgets.append(widget)
+        (
+            self.artist_entry,
+            self.item_entry,
+            self.option_entry,
+            self.category_entry,
+            self.location_entry,
+            self.quantity_entry,
+        ) = widgets
 
         ttk.Label(body, text="기록 일자").grid(row=5, column=0, sticky=tk.W, pady=(6, 0))
         date_frame = ttk.Frame(body)
         date_frame.grid(row=5, column=1, sticky=tk.W, pady=(6, 0))
-        ttk.Entry(date_frame, textvariable=self.day_var, width=14, state="readonly").pack(side=tk.LEFT)
+        self.day_entry = _prefilled_entry(date_frame, entry.get("day") or date.today().isoformat(), width=14)
+        self.day_entry.configure(state="readonly")
+        self.day_entry.pack(side=tk.LEFT)
         ttk.Button(date_frame, text="달력", command=self._open_calendar).pack(side=tk.LEFT, padx=(4, 0))
 
         ttk.Label(body, text="상세내용").grid(row=6, column=0, sticky=tk.W, pady=(6, 0))
-        ttk.Entry(body, textvariable=self.desc_var, width=40).grid(row=6, column=1, sticky=tk.W, pady=(6, 0))
+        self.desc_entry = _prefilled_entry(body, entry.get("description", ""), width=40)
+        self.desc_entry.grid(row=6, column=1, sticky=tk.W, pady=(6, 0))
 
         btns = ttk.Frame(self, padding=(12, 0, 12, 12))
         btns.pack(fill=tk.X)
@@ -428,32 +866,42 @@ class TransactionEditDialog(tk.Toplevel):
         ttk.Button(btns, text="저장", command=self._save).pack(side=tk.RIGHT, padx=(0, 8))
 
     def _open_calendar(self) -> None:
-        CalendarPopup(self, lambda d: self.day_var.set(d.isoformat()), initial_date=date.fromisoformat(self.day_var.get()))
+        day_text = self.day_entry.get()
+        initial = date.fromisoformat(day_text) if _DAY_RE.fullmatch(day_text) else date.today()
+        CalendarPopup(self, self._set_day, initial_date=initial)
+
+    def _set_day(self, day: date) -> None:
+        self.day_entry.configure(state="normal")
+        self.day_entry.delete(0, tk.END)
+        self.day_entry.insert(0, day.isoformat())
+        self.day_entry.configure(state="readonly")
 
     def _save(self) -> None:
-        artist = self.artist_var.get().strip()
-        item = self.item_var.get().strip()
-        option = self.option_var.get().strip()
-        location = self.location_var.get().strip()
-        description = self.desc_var.get().strip()
-        if not all([artist, item, location]):
+        artist = self.artist_entry.get().strip()
+        item = self.item_entry.get().strip()
+        option = self.option_entry.get().strip()
+        location = self.location_entry.get().strip()
+        description = self.desc_entry.get().strip()
+        if not (artist and item and location):
             messagebox.showerror("오류", "아티스트, 앨범/버전, 로케이션은 필수입니다.")
             return
         if self.require_description and not description:
             messagebox.showerror("오류", "출고 상세내용을 입력해 주세요.")
             return
-        try:
-            qty = int(self.quantity_var.get().strip())
-            if qty <= 0:
-                raise ValueError
-        except ValueError:
+        qty_text = self.quantity_entry.get().strip()
+        if not qty_text.isdecimal() or int(qty_text) <= 0:
             messagebox.showerror("오류", "수량은 1 이상의 정수여야 합니다.")
             return
-        day_value = self.day_var.get().strip() or date.today().isoformat()
+        qty = int(qty_text)
+        day_value = self.day_entry.get().strip() or date.today().isoformat()
+        if not _DAY_RE.fullmatch(day_value):
+            messagebox.showerror("오류", "기록 일자는 YYYY-MM-DD 형식이어야 합니다.")
+            return
+        category_label = self.category_entry.get().strip()
         self.result = {
             "artist": artist,
             "item": item,
-            "category": self.category_var.get(),
+            "category": CATEGORY_LABELS_REV.get(category_label, category_label),
             "option": option,
             "location": location,
             "quantity": qty,
@@ -510,6 +958,25 @@ class EventReturnDialog(tk.Toplevel):
         self.destroy()
 
 
+_GRID_SHIFT = 7  # 128px 격자
+MAP_DISPLAY_MAX_DIM = 2400  # 편집기에 띄우는 맵 이미지의 최대 변 길이(px)
+
+
+@dataclass(slots=True, eq=False)
+class _MapBox:
+    """One location box in the map editor (rect is in display coordinates)."""
+
+    id: str
+    location: str
+    rect: Tuple[int, int, int, int]
+    # 원본 이미지 좌표. 화면에서 옮기거나 크기를 바꾸면 None이 되고 rect에서 다시 환산한다.
+    image_rect: Optional[Tuple[int, int, int, int]] = None
+    canvas_id: Optional[int] = None
+    label_id: Optional[int] = None
+    selected: bool = False
+    grid_cells: List[Tuple[int, int]] = field(default_factory=list)
+
+
 class LocationMapEditor(tk.Toplevel):
     """Lightweight location map editor implemented with Tkinter."""
 
@@ -523,13 +990,20 @@ class LocationMapEditor(tk.Toplevel):
 
         self.map_store_path = map_path
         self.map_image_path: Optional[str] = None
+        # 화면 좌표 = 원본 이미지 좌표 * _display_scale (JSON에는 원본 좌표로 저장)
+        self._display_scale = 1.0
         self.map_name_var = tk.StringVar(value="")
-        self.selected: Optional[Dict] = None
+        self.selected: Optional[_MapBox] = None
         self._drag_start: Optional[Tuple[int, int]] = None
         self._mode: Optional[str] = None
         self._resize_anchor: Optional[str] = None
         self._creating_rect: Optional[int] = None
-        self.entries: List[Dict] = []
+        self.entries: List[_MapBox] = []
+        self._entry_by_id: Dict[str, _MapBox] = {}
+        self._next_id = 1
+        self._selected_id: Optional[str] = None
+        # 히트 테스트용 격자 인덱스: (x >> 7, y >> 7) 버킷마다 겹치는 박스 목록
+        self._grid: Dict[Tuple[int, int], List[_MapBox]] = defaultdict(list)
         self.pan_mode = tk.BooleanVar(value=False)
         self._pan_anchor: Optional[Tuple[int, int]] = None
 
@@ -613,6 +1087,14 @@ class LocationMapEditor(tk.Toplevel):
             return
         try:
             img = Image.open(path)
+            width, height = img.size
+            scale = min(1.0, MAP_DISPLAY_MAX_DIM / max(width, height, 1))
+            if scale < 1.0:
+                target = (max(1, int(width * scale)), max(1, int(height * scale)))
+                if img.format == "JPEG":
+                    img.draft("RGB", target)  # JPEG는 디코딩 단계에서 미리 축소
+                resample = getattr(Image, "Resampling", None)
+                img.thumbnail(target, resample.LANCZOS if resample else Image.LANCZOS)
             self.map_image = img
             self.map_image_tk = ImageTk.PhotoImage(img)
         except Exception as exc:  # pragma: no cover - file I/O
@@ -621,8 +1103,39 @@ class LocationMapEditor(tk.Toplevel):
         self.map_image_path = path
         if not self.map_name_var.get():
             self.map_name_var.set(os.path.basename(path))
+        self._set_display_scale(scale)
         self._redraw_background()
 
+    def _set_display_scale(self, scale: float) -> None:
+        """Change the display scale, keeping existing boxes on the same image spot."""
+        if scale == self._display_scale:
+            return
+        image_rects = [self._image_rect_of(entry) for entry in self.entries]
+        self._display_scale = scale
+        self._grid.clear()
+        for entry, rect in zip(self.entries, image_rects):
+            entry.grid_cells = []
+            entry.image_rect = rect
+            entry.rect = self._to_display_rect(rect)
+        self._update_fields_from_selected()
+
+    def _to_display_rect(self, rect) -> Tuple[int, int, int, int]:
+        s = self._display_scale
+        x, y, w, h = rect
+        return (round(x * s), round(y * s), round(w * s), round(h * s))
+
+    def _to_image_rect(self, rect) -> Tuple[int, int, int, int]:
+        s = self._display_scale
+        x, y, w, h = rect
+        return (round(x / s), round(y / s), round(w / s), round(h / s))
+
+    def _image_rect_of(self, entry: _MapBox) -> Tuple[int, int, int, int]:
+        """Return the box in image coordinates, converting from the screen only if it was edited there."""
+
+        if entry.image_rect is not None:
+            return entry.image_rect
+        return self._to_image_rect(entry.rect)
+
     def _redraw_background(self) -> None:
         self.canvas.delete("bg")
         if getattr(self, "map_image_tk", None):
@@ -630,8 +1143,15 @@ class LocationMapEditor(tk.Toplevel):
             self.canvas.configure(scrollregion=(0, 0, self.map_image_tk.width(), self.map_image_tk.height()))
         else:
             self.canvas.configure(scrollregion=(0, 0, 2000, 1200))
-        for entry in self.entries:
+        self._draw_entries(self.entries)
+
+    def _draw_entries(self, entries: List[_MapBox]) -> None:
+        """Draw several boxes and let Tk repaint once for the whole batch."""
+
+        for entry in entries:
             self._draw_entry(entry)
+        if entries:
+            self.canvas.update_idletasks()
 
     def _on_press(self, event) -> None:
         self.canvas.focus_set()
@@ -642,8 +1162,12 @@ class LocationMapEditor(tk.Toplevel):
 
         hit = self._find_entry(event.x, event.y)
         if hit:
-            self._select(hit["id"])
-            x, y, w, h = hit["rect"]
+            self._select(hit.id)
+            # 드래그 중에는 박스를 다시 만들지 않으므로 먼저 맨 위로 올려 둔다.
+            for item_id in (hit.canvas_id, hit.label_id):
+                if item_id is not None:
+                    self.canvas.tag_raise(item_id)
+            x, y, w, h = hit.rect
             pad = 6
             self._mode = "move"
             self._resize_anchor = None
@@ -687,6 +1211,8 @@ class LocationMapEditor(tk.Toplevel):
             self._resize_selected(event.x, event.y)
 
     def _on_release(self, event) -> None:
+        if self._mode in ("move", "resize") and self.selected:
+            self._index_entry(self.selected)
         if self._mode == "create" and self._creating_rect:
             x0, y0, x1, y1 = self.canvas.coords(self._creating_rect)
             self.canvas.delete(self._creating_rect)
@@ -698,10 +1224,10 @@ class LocationMapEditor(tk.Toplevel):
             if not name:
                 return
             rect = (int(min(x0, x1)), int(min(y0, y1)), int(abs(x1 - x0)), int(abs(y1 - y0)))
-            entry = {"id": f"loc-{len(self.entries)+1}", "location": name, "rect": rect}
-            self.entries.append(entry)
+            entry = _MapBox(self._new_entry_id(), name, rect)
+            self._add_entry(entry)
             self._draw_entry(entry)
-            self._select(entry["id"])
+            self._select(entry.id)
             self._maybe_prompt_batch(entry)
         self._mode = None
         self._drag_start = None
@@ -713,48 +1239,96 @@ class LocationMapEditor(tk.Toplevel):
         else:
             self.canvas.yview_scroll(int(delta), "units")
 
-    def _find_entry(self, x: int, y: int) -> Optional[Dict]:
-        for entry in reversed(self.entries):
-            ex, ey, ew, eh = entry["rect"]
+    def _find_entry(self, x: int, y: int) -> Optional[_MapBox]:
+        x, y = int(x), int(y)
+        bucket = self._grid.get((x >> _GRID_SHIFT, y >> _GRID_SHIFT))
+        if not bucket:
+            return None
+        # 버킷은 그려진 순서를 따르므로 뒤에서부터 보면 가장 위의 박스가 먼저 걸린다.
+        for entry in reversed(bucket):
+            ex, ey, ew, eh = entry.rect
             if ex <= x <= ex + ew and ey <= y <= ey + eh:
                 return entry
         return None
 
+    def _index_entry(self, entry: _MapBox) -> None:
+        self._unindex_entry(entry)
+        x, y, w, h = (int(v) for v in entry.rect)
+        cells = [
+            (cx, cy)
+            for cx in range(x >> _GRID_SHIFT, ((x + w) >> _GRID_SHIFT) + 1)
+            for cy in range(y >> _GRID_SHIFT, ((y + h) >> _GRID_SHIFT) + 1)
+        ]
+        for cell in cells:
+            self._grid[cell].append(entry)
+        entry.grid_cells = cells
+
+    def _unindex_entry(self, entry: _MapBox) -> None:
+        cells, entry.grid_cells = entry.grid_cells, []
+        for cell in cells:
+            bucket = self._grid.get(cell)
+            if not bucket:
+                continue
+            for pos in range(len(bucket) - 1, -1, -1):
+                if bucket[pos] is entry:
+                    del bucket[pos]
+                    break
+            if not bucket:
+                del self._grid[cell]
+
+    def _new_entry_id(self) -> str:
+        # 삭제 후에도 겹치지 않도록 len(self.entries) 대신 증가 카운터를 쓴다.
+        entry_id = f"loc-{self._next_id}"
+        self._next_id += 1
+        return entry_id
+
+    def _add_entry(self, entry: _MapBox) -> None:
+        self.entries.append(entry)
+        self._entry_by_id[entry.id] = entry
+
     def _select(self, entry_id: str) -> None:
-        for entry in self.entries:
-            entry["selected"] = entry["id"] == entry_id
-            self._draw_entry(entry)
-        self.selected = next((e for e in self.entries if e["id"] == entry_id), None)
+        # 선택 상태가 바뀐 두 박스의 외곽선 색만 바꾼다.
+        prev = self._entry_by_id.get(self._selected_id) if self._selected_id else None
+        if prev is not None and prev.id != entry_id:
+            prev.selected = False
+            if prev.canvas_id is not None:
+                self.canvas.itemconfigure(prev.canvas_id, outline="#1f2937")
+        self.selected = self._entry_by_id.get(entry_id)
+        self._selected_id = entry_id if self.selected else None
         if self.selected:
-            x, y, w, h = self.selected["rect"]
-            self.loc_name_var.set(self.selected.get("location", ""))
-            self.x_var.set(int(x))
-            self.y_var.set(int(y))
-            self.w_var.set(int(w))
-            self.h_var.set(int(h))
-
-    def _draw_entry(self, entry: Dict) -> None:
-        if "canvas_id" in entry:
-            self.canvas.delete(entry["canvas_id"])
-        if "label_id" in entry:
-            self.canvas.delete(entry["label_id"])
-        x, y, w, h = entry["rect"]
-        outline = "#2563eb" if entry.get("selected") else "#1f2937"
-        entry["canvas_id"] = self.canvas.create_rectangle(x, y, x + w, y + h, outline=outline, width=2)
-        entry["label_id"] = self.canvas.create_text(x + 4, y + 4, anchor="nw", text=entry.get("location", ""))
+            self.selected.selected = True
+            if self.selected.canvas_id is not None:
+                self.canvas.itemconfigure(self.selected.canvas_id, outline="#2563eb")
+            self.loc_name_var.set(self.selected.location)
+            self._update_fields_from_selected()
+
+    def _draw_entry(self, entry: _MapBox) -> None:
+        if entry.canvas_id is not None:
+            self.canvas.delete(entry.canvas_id)
+        if entry.label_id is not None:
+            self.canvas.delete(entry.label_id)
+        x, y, w, h = entry.rect
+        outline = "#2563eb" if entry.selected else "#1f2937"
+        entry.canvas_id = self.canvas.create_rectangle(x, y, x + w, y + h, outline=outline, width=2)
+        entry.label_id = self.canvas.create_text(x + 4, y + 4, anchor="nw", text=entry.location)
+        # 다시 그린 박스는 캔버스 맨 위에 올라가므로 격자 버킷에서도 맨 뒤로 보낸다.
+        self._index_entry(entry)
 
     def _offset_selected(self, dx: int, dy: int) -> None:
         if not self.selected:
             return
-        x, y, w, h = self.selected["rect"]
-        self.selected["rect"] = (x + dx, y + dy, w, h)
-        self._draw_entry(self.selected)
+        x, y, w, h = self.selected.rect
+        self.selected.rect = (x + dx, y + dy, w, h)
+        self.selected.image_rect = None
+        for item_id in (self.selected.canvas_id, self.selected.label_id):
+            if item_id is not None:
+                self.canvas.move(item_id, dx, dy)
         self._update_fields_from_selected()
 
     def _resize_selected(self, x: int, y: int) -> None:
         if not self.selected or not self._resize_anchor:
             return
-        sx, sy, w, h = self.selected["rect"]
+        sx, sy, w, h = self.selected.rect
         left, top, right, bottom = sx, sy, sx + w, sy + h
         if "w" in self._resize_anchor:
             left = x
@@ -768,14 +1342,19 @@ class LocationMapEditor(tk.Toplevel):
         new_w, new_h = abs(right - left), abs(bottom - top)
         if new_w < 5 or new_h < 5:
             return
-        self.selected["rect"] = (int(new_x), int(new_y), int(new_w), int(new_h))
-        self._draw_entry(self.selected)
+        self.selected.rect = (int(new_x), int(new_y), int(new_w), int(new_h))
+        self.selected.image_rect = None
+        if self.selected.canvas_id is not None:
+            self.canvas.coords(self.selected.canvas_id, new_x, new_y, new_x + new_w, new_y + new_h)
+        if self.selected.label_id is not None:
+            self.canvas.coords(self.selected.label_id, new_x + 4, new_y + 4)
         self._update_fields_from_selected()
 
     def _update_fields_from_selected(self) -> None:
         if not self.selected:
             return
-        x, y, w, h = self.selected["rect"]
+        # 입력칸에는 JSON과 같은 원본 이미지 좌표를 보여준다.
+        x, y, w, h = self._image_rect_of(self.selected)
         self.x_var.set(int(x))
         self.y_var.set(int(y))
         self.w_var.set(int(w))
@@ -784,26 +1363,44 @@ class LocationMapEditor(tk.Toplevel):
     def _apply_fields(self) -> None:
         if not self.selected:
             return
+        box = self.selected
+        try:
+            # IntVar.get()은 이미 int를 돌려준다.
+            x, y, w, h = self.x_var.get(), self.y_var.get(), self.w_var.get(), self.h_var.get()
+        except tk.TclError:
+            messagebox.showerror("숫자 필요", "X/Y/Width/Height는 정수로 입력해 주세요.", parent=self)
+            return
         name = self.loc_name_var.get().strip()
-        if name:
-            self.selected["location"] = name
-        self.selected["rect"] = (
-            int(self.x_var.get()),
-            int(self.y_var.get()),
-            max(1, int(self.w_var.get())),
-            max(1, int(self.h_var.get())),
-        )
-        self._draw_entry(self.selected)
+        if name and name != box.location:
+            box.location = name
+            if box.label_id is not None:
+                self.canvas.itemconfigure(box.label_id, text=name)
+        # 입력한 값이 곧 원본 좌표이므로 그대로 보관하고, 화면 좌표만 환산한다.
+        box.image_rect = (x, y, w if w > 1 else 1, h if h > 1 else 1)
+        x, y, w, h = self._to_display_rect(box.image_rect)
+        rect = (x, y, w if w > 1 else 1, h if h > 1 else 1)
+        if rect == box.rect:
+            return  # 좌표가 그대로면 다시 그리지 않는다.
+        box.rect = rect
+        x, y, w, h = rect
+        if box.canvas_id is not None:
+            self.canvas.coords(box.canvas_id, x, y, x + w, y + h)
+        if box.label_id is not None:
+            self.canvas.coords(box.label_id, x + 4, y + 4)
+        self._index_entry(box)
 
     def _delete_selected(self) -> None:
         if not self.selected:
             return
         to_delete = self.selected
         self.selected = None
-        self.entries = [e for e in self.entries if e["id"] != to_delete["id"]]
-        for key in ("canvas_id", "label_id"):
-            if key in to_delete:
-                self.canvas.delete(to_delete[key])
+        self._selected_id = None
+        del self._entry_by_id[to_delete.id]
+        self.entries.remove(to_delete)
+        self._unindex_entry(to_delete)
+        for item_id in (to_delete.canvas_id, to_delete.label_id):
+            if item_id is not None:
+                self.canvas.delete(item_id)
         self.loc_name_var.set("")
         for var in (self.x_var, self.y_var, self.w_var, self.h_var):
             var.set(0)
@@ -816,11 +1413,10 @@ class LocationMapEditor(tk.Toplevel):
         )
         if not path:
             return
-        entries = load_location_entries(path)
-        if not entries:
+        maps = sorted(location_map_names(path))
+        if not maps:
             messagebox.showinfo("안내", "불러올 로케이션 데이터가 없습니다.")
             return
-        maps = sorted({entry.get("map", "") for entry in entries})
         chosen_map = self.map_name_var.get() or (maps[0] if maps else "")
         if len(maps) > 1:
             chosen_map = simpledialog.askstring(
@@ -831,20 +1427,26 @@ class LocationMapEditor(tk.Toplevel):
             )
             if chosen_map is None:
                 return
-        filtered = [e for e in entries if (e.get("map") or "") == chosen_map]
+        filtered = list(iter_location_entries(path, chosen_map))
         if not filtered:
             messagebox.showinfo("안내", "선택한 맵에 대한 데이터가 없습니다.")
             return
         self.entries = []
-        for idx, ent in enumerate(filtered, start=1):
-            rect = ent.get("rect") or [0, 0, 0, 0]
-            safe_rect = (int(rect[0]), int(rect[1]), int(rect[2]), int(rect[3])) if len(rect) == 4 else (0, 0, 0, 0)
-            entry = {"id": f"loc-{idx}", "location": ent.get("location", ""), "rect": safe_rect}
-            self.entries.append(entry)
+        self._entry_by_id = {}
+        self._next_id = 1
+        self._selected_id = None
+        self.selected = None
+        self._grid.clear()
+        for ent in filtered:
+            # rect는 로더에서 이미 정수 네 개(또는 빈 목록)로 정리돼 있다.
+            rect = tuple(ent.get("rect") or (0, 0, 0, 0))
+            self._add_entry(
+                _MapBox(self._new_entry_id(), ent.get("location", ""), self._to_display_rect(rect), image_rect=rect)
+            )
         self.map_name_var.set(chosen_map)
         self._redraw_background()
         if self.entries:
-            self._select(self.entries[0]["id"])
+            self._select(self.entries[0].id)
 
     def _save_json(self) -> None:
         if not self.entries:
@@ -854,21 +1456,15 @@ class LocationMapEditor(tk.Toplevel):
         if not map_name:
             messagebox.showerror("맵 이름 필요", "맵 이름을 입력해 주세요.")
             return
-        payload = []
-        for ent in self.entries:
-            x, y, w, h = ent["rect"]
-            payload.append(
-                {
-                    "map": map_name,
-                    "location": ent.get("location", ""),
-                    "rect": [int(x), int(y), int(w), int(h)],
-                }
-            )
-        save_location_entries(payload, self.map_store_path)
+        def _payload(ent: _MapBox) -> Dict:
+            x, y, w, h = self._image_rect_of(ent)
+            return {"map": map_name, "location": ent.location, "rect": [int(x), int(y), int(w), int(h)]}
+
+        save_location_entries((_payload(ent) for ent in self.entries), self.map_store_path)
         messagebox.showinfo("저장 완료", f"{self.map_store_path}에 저장했습니다.")
 
     # ------------------------------------------------------------------ helpers
-    def _maybe_prompt_batch(self, base_entry: Dict) -> None:
+    def _maybe_prompt_batch(self, base_entry: _MapBox) -> None:
         if not base_entry:
             return
 
@@ -882,7 +1478,7 @@ class LocationMapEditor(tk.Toplevel):
             )
 
             ttk.Label(dlg, text="기본 이름").grid(row=1, column=0, padx=12, pady=4, sticky="e")
-            prefix_var = tk.StringVar(value=base_entry.get("location", ""))
+            prefix_var = tk.StringVar(value=base_entry.location)
             ttk.Entry(dlg, textvariable=prefix_var, width=26).grid(row=1, column=1, padx=12, pady=4, sticky="w")
 
             ttk.Label(dlg, text="세부 구간 수").grid(row=2, column=0, padx=12, pady=4, sticky="e")
@@ -931,41 +1527,42 @@ class LocationMapEditor(tk.Toplevel):
             self.after_idle(_open_dialog)
 
     def _create_segments(
-        self, base_entry: Dict, prefix: str, count: int, start_index: int, direction: str
-    ) -> List[Dict]:
-        x, y, w, h = base_entry.get("rect", (0, 0, 0, 0))
-        segments: List[Dict] = []
-        if direction in ("LR", "RL"):
-            step = w / count
-            if step < 4:
+        self, base_entry: _MapBox, prefix: str, count: int, start_index: int, direction: str
+    ) -> List[_MapBox]:
+        x, y, w, h = base_entry.rect
+        horizontal = direction in ("LR", "RL")
+        length = w if horizontal else h
+        step = length / count
+        if step < 4:
+            if horizontal:
                 messagebox.showerror("너비 부족", "구간이 너무 작습니다. 구간 수를 줄여 주세요.", parent=self)
-                return []
-            order = range(count) if direction == "LR" else reversed(range(count))
-            for idx, seg in enumerate(order):
-                sx = x + int(seg * step)
-                sw = int(step) if seg < count - 1 else w - int(step) * (count - 1)
-                name = f"{prefix}-{str(start_index + idx).zfill(2)}"
-                seg_entry = {"id": f"loc-{len(self.entries)+len(segments)+1}", "location": name, "rect": (sx, y, sw, h)}
-                segments.append(seg_entry)
-        else:
-            step = h / count
-            if step < 4:
+            else:
                 messagebox.showerror("높이 부족", "구간이 너무 작습니다. 구간 수를 줄여 주세요.", parent=self)
-                return []
-            order = range(count) if direction == "TB" else reversed(range(count))
-            for idx, seg in enumerate(order):
-                sy = y + int(seg * step)
-                sh = int(step) if seg < count - 1 else h - int(step) * (count - 1)
-                name = f"{prefix}-{str(start_index + idx).zfill(2)}"
-                seg_entry = {"id": f"loc-{len(self.entries)+len(segments)+1}", "location": name, "rect": (x, sy, w, sh)}
-                segments.append(seg_entry)
+            return []
+        # 구간 위치/크기를 한 번에 계산한다. 마지막 구간이 나머지 길이를 흡수한다.
+        base = int(step)
+        offsets = [int(seg * step) for seg in range(count)]
+        sizes = [base] * (count - 1) + [length - base * (count - 1)]
+        order = range(count) if direction in ("LR", "TB") else range(count - 1, -1, -1)
+        segments: List[_MapBox] = []
+        for idx, seg in enumerate(order):
+            if horizontal:
+                rect = (x + offsets[seg], y, sizes[seg], h)
+            else:
+                rect = (x, y + offsets[seg], w, sizes[seg])
+            name = f"{prefix}-{str(start_index + idx).zfill(2)}"
+            segments.append(_MapBox(self._new_entry_id(), name, rect))
 
         for ent in segments:
-            self.entries.append(ent)
-            self._draw_entry(ent)
+            self._add_entry(ent)
+        self._draw_entries(segments)
         return segments
 
 
+_SCALED_IMAGE_CACHE_SIZE = 8
+_RESIZE_POLL_MS = 30
+
+
 class LocationMapViewer(tk.Toplevel):
     """Display a saved map image with highlighted rectangle for a location."""
 
@@ -982,9 +1579,21 @@ class LocationMapViewer(tk.Toplevel):
         self.scale = 1.0
         self.image = None
         self.image_tk = None
+        self._image_path: Optional[str] = None
+        # (맵 경로, 배율) -> PhotoImage. 같은 배율/맵으로 돌아오면 리사이즈를 생략한다.
+        self._scaled_cache: "OrderedDict[Tuple[str, float], object]" = OrderedDict()
+        self._resize_pool = ThreadPoolExecutor(max_workers=1)
+        # winfo_*/PhotoImage 크기 조회 대신 이벤트로 받은 값을 보관한다.
+        self._canvas_size: Optional[Tuple[int, int]] = None
+        self._image_dims: Tuple[int, int] = (0, 0)
+        self._center_pending = False
+        self._bg_item: Optional[int] = None
+        self._wanted_key: Optional[Tuple[str, float]] = None
+        self._closed = False
         self._overlay_rect: Optional[int] = None
         self._overlay_text: Optional[int] = None
         self._blink_job: Optional[str] = None
+        self._zoom_job: Optional[str] = None
         self._blink_index = 0
         self._blink_palette = [
             {"fill": "#f97316", "outline": "#fb923c", "text": "#0f172a"},  # orange
@@ -1020,7 +1629,8 @@ class LocationMapViewer(tk.Toplevel):
         self.canvas.bind("<B2-Motion>", self._on_pan)
         self.canvas.bind("<ButtonRelease-1>", self._stop_pan)
         self.canvas.bind("<ButtonRelease-2>", self._stop_pan)
-        self._pan_start: Optional[Tuple[int, int]] = None
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self._panning = False
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
@@ -1036,64 +1646,112 @@ class LocationMapViewer(tk.Toplevel):
             map_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), map_path)
         if not os.path.exists(map_path):
             messagebox.showerror("맵 이미지 없음", f"{map_path} 파일을 찾을 수 없습니다.")
-            self.destroy()
+            self._on_close()
             return
         if Image is None:
             messagebox.showerror("Pillow 필요", "맵 이미지를 표시하려면 Pillow(PIL)가 필요합니다.")
-            self.destroy()
-            return
-        try:
-            self.image = Image.open(map_path)
-        except Exception as exc:  # pragma: no cover - file I/O
-            messagebox.showerror("이미지 로드 실패", str(exc))
-            self.destroy()
+            self._on_close()
             return
+        if map_path != self._image_path:
+            try:
+                self.image = Image.open(map_path)
+            except Exception as exc:  # pragma: no cover - file I/O
+                messagebox.showerror("이미지 로드 실패", str(exc))
+                self._on_close()
+                return
+            self._image_path = map_path
         self.scale = 1.0
-        self._update_image()
         self.caption_var.set(f"{entry.get('location')} @ {os.path.basename(map_path)} ({self.index+1}/{len(self.entries)})")
-        self._center_on_current()
+        self._update_image(on_ready=self._center_on_current)
 
-    def _update_image(self) -> None:
+    def _update_image(self, on_ready=None) -> None:
         if not self.image:
             return
+        key = (self._image_path or "", round(self.scale, 3))
+        self._wanted_key = key
+        image_tk = self._scaled_cache.get(key)
+        if image_tk is not None:
+            self._scaled_cache.move_to_end(key)
+            self._show_scaled(image_tk, on_ready)
+            return
         resample = getattr(Image, "Resampling", None)
-        method = resample.LANCZOS if resample else Image.LANCZOS
-        scaled = self.image.resize(
-            (int(self.image.width * self.scale), int(self.image.height * self.scale)),
-            resample=method,
-        )
-        self.image_tk = ImageTk.PhotoImage(scaled)
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, image=self.image_tk, anchor="nw", tags="bg")
-        self.canvas.configure(scrollregion=(0, 0, scaled.width, scaled.height))
+        # 축소는 BILINEAR로도 충분하고 LANCZOS보다 훨씬 싸다.
+        if self.scale < 1.0:
+            method = resample.BILINEAR if resample else Image.BILINEAR
+        else:
+            method = resample.LANCZOS if resample else Image.LANCZOS
+        size = (int(self.image.width * self.scale), int(self.image.height * self.scale))
+        # 리사이즈는 작업 스레드에서, PhotoImage 생성과 캔버스 갱신은 Tk 스레드에서 한다.
+        future = self._resize_pool.submit(self.image.resize, size, resample=method)
+        self.after(_RESIZE_POLL_MS, self._poll_resize, future, key, on_ready)
+
+    def _poll_resize(self, future, key: Tuple[str, float], on_ready) -> None:
+        if self._closed:
+            return
+        if not future.done():
+            self.after(_RESIZE_POLL_MS, self._poll_resize, future, key, on_ready)
+            return
+        try:
+            scaled = future.result()
+        except Exception as exc:  # pragma: no cover - file I/O
+            messagebox.showerror("이미지 로드 실패", str(exc), parent=self)
+            return
+        image_tk = ImageTk.PhotoImage(scaled)
+        self._scaled_cache[key] = image_tk
+        if len(self._scaled_cache) > _SCALED_IMAGE_CACHE_SIZE:
+            self._scaled_cache.popitem(last=False)
+        if key == self._wanted_key:  # 그 사이 더 최근 요청이 있으면 캐시만 해 둔다.
+            self._show_scaled(image_tk, on_ready)
+
+    def _show_scaled(self, image_tk, on_ready=None) -> None:
+        self.image_tk = image_tk
+        self._image_dims = (image_tk.width(), image_tk.height())
+        # 배경 이미지 아이템은 한 번만 만들고 이후에는 이미지만 바꿔 끼운다.
+        if self._bg_item is None:
+            self._bg_item = self.canvas.create_image(0, 0, image=image_tk, anchor="nw", tags="bg")
+            self.canvas.tag_lower(self._bg_item)
+        else:
+            self.canvas.itemconfigure(self._bg_item, image=image_tk)
+        self.canvas.configure(scrollregion=(0, 0) + self._image_dims)
         self._draw_overlay()
+        if on_ready is not None:
+            on_ready()
 
     def _draw_overlay(self) -> None:
         entry = self._current()
         rect = entry.get("rect") or [0, 0, 0, 0]
         if len(rect) != 4:
+            self._cancel_blink()
+            self.canvas.itemconfigure("overlay", state="hidden")
             return
         self._cancel_blink()
+        self.canvas.itemconfigure("overlay", state="normal")
         x, y, w, h = rect
         sx = x * self.scale
         sy = y * self.scale
         sw = w * self.scale
         sh = h * self.scale
-        self.canvas.delete("overlay")
-        self._overlay_rect = self.canvas.create_rectangle(
-            sx,
-            sy,
-            sx + sw,
-            sy + sh,
-            outline="#f97316",
-            width=4,
-            fill="#f97316",
-            stipple="gray25",
-            tags="overlay",
-        )
-        self._overlay_text = self.canvas.create_text(
-            sx + sw / 2, sy + sh / 2, text="여기입니다", fill="#0f172a", font=("Arial", 13, "bold"), tags="overlay"
-        )
+        if self._overlay_rect is not None and self._overlay_text is not None:
+            palette = self._blink_palette[0]
+            self.canvas.coords(self._overlay_rect, sx, sy, sx + sw, sy + sh)
+            self.canvas.itemconfigure(self._overlay_rect, fill=palette["fill"], outline="#f97316")
+            self.canvas.coords(self._overlay_text, sx + sw / 2, sy + sh / 2)
+            self.canvas.itemconfigure(self._overlay_text, fill=palette["text"])
+        else:
+            self._overlay_rect = self.canvas.create_rectangle(
+                sx,
+                sy,
+                sx + sw,
+                sy + sh,
+                outline="#f97316",
+                width=4,
+                fill="#f97316",
+                stipple="gray25",
+                tags="overlay",
+            )
+            self._overlay_text = self.canvas.create_text(
+                sx + sw / 2, sy + sh / 2, text="여기입니다", fill="#0f172a", font=("Arial", 13, "bold"), tags="overlay"
+            )
         self._blink_index = 0
         self._start_blink()
 
@@ -1102,9 +1760,26 @@ class LocationMapViewer(tk.Toplevel):
         # faster cycle for improved visibility
         self._blink_job = self.after(300, self._blink)
 
+    def _overlay_visible(self) -> bool:
+        bbox = self.canvas.bbox(self._overlay_rect)
+        if not bbox:
+            return False
+        if self._canvas_size is None:
+            return True
+        vx0 = self.canvas.canvasx(0)
+        vy0 = self.canvas.canvasy(0)
+        vx1 = vx0 + self._canvas_size[0]
+        vy1 = vy0 + self._canvas_size[1]
+        bx0, by0, bx1, by1 = bbox
+        return bx0 < vx1 and bx1 > vx0 and by0 < vy1 and by1 > vy0
+
     def _blink(self) -> None:
         if not self._overlay_rect or not self.winfo_exists():
             return
+        if not self._overlay_visible():
+            # 화면 밖이면 색을 바꾸지 않고 느린 주기로 다시 확인만 한다.
+            self._blink_job = self.after(1000, self._blink)
+            return
         self._blink_index = (self._blink_index + 1) % len(self._blink_palette)
         palette = self._blink_palette[self._blink_index]
         self.canvas.itemconfigure(
@@ -1125,33 +1800,38 @@ class LocationMapViewer(tk.Toplevel):
                 pass
             self._blink_job = None
 
+    def _on_canvas_configure(self, event) -> None:
+        self._canvas_size = (event.width, event.height)
+        if self._center_pending:
+            self._center_pending = False
+            self._center_on_current()
+
     def _center_on_current(self) -> None:
         entry = self._current()
         rect = entry.get("rect") or [0, 0, 0, 0]
         if len(rect) != 4 or not self.image_tk:
             return
+        if self._canvas_size is None:
+            # 캔버스 크기는 첫 <Configure> 이후에야 알 수 있다.
+            self._center_pending = True
+            return
+        canvas_w, canvas_h = self._canvas_size
+        image_w, image_h = self._image_dims
+        x, y, w, h = rect
+        sx = x * self.scale
+        sy = y * self.scale
+        sw = w * self.scale
+        sh = h * self.scale
+        cx = sx + sw / 2
+        cy = sy + sh / 2
+        total_w = max(image_w, canvas_w)
+        total_h = max(image_h, canvas_h)
 
-        def _do_center() -> None:
-            canvas_w = max(1, self.canvas.winfo_width())
-            canvas_h = max(1, self.canvas.winfo_height())
-            x, y, w, h = rect
-            sx = x * self.scale
-            sy = y * self.scale
-            sw = w * self.scale
-            sh = h * self.scale
-            cx = sx + sw / 2
-            cy = sy + sh / 2
-            total_w = max(self.image_tk.width(), canvas_w)
-            total_h = max(self.image_tk.height(), canvas_h)
-
-            def clamp(val: float) -> float:
-                return max(0.0, min(1.0, val))
-
-            self.canvas.xview_moveto(clamp((cx - canvas_w / 2) / total_w))
-            self.canvas.yview_moveto(clamp((cy - canvas_h / 2) / total_h))
+        def clamp(val: float) -> float:
+            return max(0.0, min(1.0, val))
 
-        # Canvas sizes are valid only after it is drawn.
-        self.after_idle(_do_center)
+        self.canvas.xview_moveto(clamp((cx - canvas_w / 2) / total_w))
+        self.canvas.yview_moveto(clamp((cy - canvas_h / 2) / total_h))
 
     def _on_wheel(self, event) -> None:
         if event.state & 0x4:  # Ctrl + 휠은 확대/축소
@@ -1168,22 +1848,24 @@ class LocationMapViewer(tk.Toplevel):
             return
         delta = 1.1 if event.delta > 0 else 0.9
         self.scale = max(0.2, min(5.0, self.scale * delta))
+        # 연속 휠 입력은 유휴 시점에 한 번만 다시 그린다.
+        if self._zoom_job is None:
+            self._zoom_job = self.after_idle(self._apply_zoom)
+
+    def _apply_zoom(self) -> None:
+        self._zoom_job = None
         self._update_image()
 
     def _start_pan(self, event) -> None:
-        self._pan_start = (event.x, event.y)
+        self.canvas.scan_mark(event.x, event.y)
+        self._panning = True
 
     def _on_pan(self, event) -> None:
-        if not self._pan_start:
-            return
-        dx = self._pan_start[0] - event.x
-        dy = self._pan_start[1] - event.y
-        self.canvas.xview_scroll(int(dx / 2), "units")
-        self.canvas.yview_scroll(int(dy / 2), "units")
-        self._pan_start = (event.x, event.y)
+        if self._panning:
+            self.canvas.scan_dragto(event.x, event.y, gain=1)
 
     def _stop_pan(self, _event=None) -> None:
-        self._pan_start = None
+        self._panning = False
 
     def _next(self) -> None:
         self.index = (self.index + 1) % len(self.entries)
@@ -1194,19 +1876,113 @@ class LocationMapViewer(tk.Toplevel):
         self._render()
 
     def _on_close(self) -> None:
+        self._closed = True
+        self._resize_pool.shutdown(wait=False)
         self._cancel_blink()
+        if self._zoom_job is not None:
+            self.after_cancel(self._zoom_job)
+            self._zoom_job = None
         self.destroy()
 
 
+_STOCK_RENDER_CHUNK = 300  # 화면 밖 재고 행을 한 번에 넣는 개수
+
+
+@dataclass(slots=True, frozen=True)
+class StockTable:
+    """Current stock rows stored column by column (quantities as compact int64 arrays)."""
+
+    categories: List[str] = field(default_factory=list)
+    artists: List[str] = field(default_factory=list)
+    items: List[str] = field(default_factory=list)
+    options: List[str] = field(default_factory=list)
+    openings: array = field(default_factory=lambda: array("q"))
+    in_totals: array = field(default_factory=lambda: array("q"))
+    out_totals: array = field(default_factory=lambda: array("q"))
+    qtys: array = field(default_factory=lambda: array("q"))
+    audits: List[str] = field(default_factory=list)
+    locations: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def rows(self) -> Iterator[Tuple[str, str, str, str, int, int, int, int, str, str]]:
+        """Yield export-ordered row tuples lazily."""
+
+        return zip(
+            self.categories,
+            self.artists,
+            self.items,
+            self.options,
+            self.openings,
+            self.in_totals,
+            self.out_totals,
+            self.qtys,
+            self.audits,
+            self.locations,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class StockSnapshot:
+    """Copy of the data the stock rows are built from, taken on the Tk thread for the worker.
+
+    Stock and item metadata are copied because the Tk thread edits them in place. History is
+    copied as a tuple of the same entry dicts, and period opening stock is shared as-is since
+    it is only ever replaced, never edited.
+    """
+
+    version: int
+    stock: Dict[str, Dict[str, Dict[str, int]]]
+    metadata: Dict[str, Dict]
+    history: Tuple[Dict, ...]
+    periods: Dict[str, Dict]
+
+    @classmethod
+    def from_data(cls, data: Dict, version: int) -> "StockSnapshot":
+        metadata: Dict[str, Dict] = {}
+        for item, info in data.get("item_metadata", {}).items():
+            if isinstance(info, dict):
+                info = dict(info)
+                if isinstance(info.get("last_audit"), dict):
+                    info["last_audit"] = dict(info["last_audit"])
+            metadata[item] = info
+        return cls(
+            version=version,
+            stock={
+                item: {option: dict(locations) for option, locations in options.items()}
+                for item, options in data.get("stock", {}).items()
+            },
+            metadata=metadata,
+            history=tuple(data.get("history", [])),
+            periods=dict(data.get("periods", {})),
+        )
+
+
+_STOCK_ROWS_CACHE_SIZE = 8
+_ACTIVITY_CACHE_SIZE = 64
+_STOCK_POLL_MS = 20
+_FILTER_DEBOUNCE_MS = 120
+_HISTORY_REFRESH_MS = 50
+_ROW_SORT_KEY = itemgetter("_sort_key")
+_STOCK_ROW_FIELDS = itemgetter(
+    "id", "category", "artist", "item", "option", "opening", "in_total", "out_total", "qty",
+    "audit_label", "audit_tag", "audit_partial",
+)
+
+
 class InventoryApp:
     """Simple desktop window that wraps the CLI helpers with Tkinter widgets."""
 
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Inventory Manager")
-        self.settings = load_settings()
+        self.settings = get_settings()
         self.data = load_data()
-        self.data.setdefault("activity_log", [])
+        self.activity_log = load_activity_log()
+        # 파일에는 deque보다 많은 줄이 남아 있을 수 있으므로 실제 줄 수부터 센다.
+        self._activity_log_lines = count_lines(ACTIVITY_LOG_FILE)
+        self._activity_log_fp = None
         if self.data.get("last_load_error"):
             err = self.data["last_load_error"]
             messagebox.showwarning(
@@ -1216,12 +1992,38 @@ class InventoryApp:
                 f"백업: {err.get('corrupt_backup')}",
             )
         self._save_queue = AsyncSaveQueue()
-        self._activity_cache: Dict[Tuple[str, str, int, Optional[str]], Dict[Tuple[str, str], Dict[str, int]]] = {}
+        self._activity_cache: "OrderedDict[Tuple[str, str, int], Dict[Tuple[str, str], Dict[str, int]]]" = OrderedDict()
         self.history_cache: Dict[str, List[Dict]] = {"in": [], "out": []}
         self.history_indices: Dict[str, List[int]] = {"in": [], "out": []}
-        self.stock_rows: List[Tuple[str, str, str, int, int, int, int, str, str]] = []
+        self.stock_table = StockTable()
         self.stock_row_lookup: Dict[str, Dict[str, object]] = {}
         self.checked_stock_ids: set[str] = set()
+        self._stock_export_running = False
+        self._refresh_stock_job: Optional[str] = None
+        self._history_refresh_job: Optional[str] = None
+        self._stock_render_job: Optional[str] = None
+        self._stock_view_rows: List[Tuple[str, Tuple, List[str]]] = []
+        # 트리에 실제로 들어가 있는 행의 (values, tags). 다음 새로고침 때 바뀐 행만 고친다.
+        self._stock_row_signatures: Dict[str, Tuple[Tuple, List[str]]] = {}
+        # 데이터가 바뀔 때마다(저장/다시 불러오기/복원) 증가하는 버전. 파생 캐시의 무효화 기준이다.
+        self._data_version = 0
+        self._stock_snapshot_cache: Optional[StockSnapshot] = None
+        self._stock_locations_cache: Tuple[int, Set[str]] = (-1, set())
+        self._stock_index_cache: Tuple[
+            int, Dict[Optional[str], Set[str]], Dict[str, Dict[str, Set[str]]], Dict[Tuple[str, str], int]
+        ] = (-1, {}, {}, {})
+        self._stock_rows_cache: "OrderedDict[tuple, List[Dict[str, object]]]" = OrderedDict()
+        self._audit_cache: Tuple[int, Optional[date], Dict[tuple, Tuple[str, str, bool]]] = (-1, None, {})
+        self._history_totals_cache: Tuple[
+            int, Dict[Optional[str], Counter], Dict[Tuple[Optional[str], Optional[str]], Counter]
+        ] = (-1, {}, {})
+        # 위 파생 캐시들은 Tk 스레드와 재고 행 작업 스레드가 함께 읽고 쓰므로 이 락 안에서만 꺼내고 바꾼다.
+        # 계산 자체는 락 밖에서 하고, 더 오래된 스냅샷의 결과로 새 캐시를 덮어쓰지 않는다.
+        self._cache_lock = threading.Lock()
+        # 재고 행 계산은 작업 스레드 하나에서 돌리고, 가장 최근 요청의 결과만 반영한다.
+        self._stock_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stock-rows")
+        self._refresh_tokens = itertools.count(1)
+        self._refresh_token = 0
         self.audit_counts: Dict[str, int] = {}
         self.audit_entry_map: Dict[str, Dict[str, object]] = {}
         self.audit_window: Optional[tk.Toplevel] = None
@@ -1236,10 +2038,18 @@ class InventoryApp:
         self.current_history_type = "in"
         self.history_event_filter = False
         self._hover_location_row: Optional[str] = None
+        self._stock_cursor = ""
+        self._stock_motion_xy: Tuple[int, int] = (0, 0)
+        self._stock_motion_job: Optional[str] = None
+        self._sorted_artists_cache: Tuple[int, List[str]] = (-1, [])
+        # 콤보박스에 마지막으로 넣은 목록. 같으면 Tcl로 다시 넘기지 않는다.
+        self._artist_filter_options: List[str] = []
+        self._location_filter_options: List[str] = []
         self._event_sessions: Dict[str, str] = {}
         self._lock_window: Optional[tk.Toplevel] = None
         self.last_activity = datetime.now()
         self._idle_job: Optional[str] = None
+        self._migrate_legacy_activity_log()
         self._build_layout()
         self._apply_location_presets()
         self._bind_activity_hooks()
@@ -1247,6 +2057,7 @@ class InventoryApp:
         self.refresh_stock()
         self._initialize_history_defaults()
         self._start_idle_watch()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_root_close)
         self._maybe_lock_on_start()
 
     # ------------------------------------------------------------------ UI setup
@@ -1289,6 +2100,7 @@ class InventoryApp:
     # ------------------------------------------------------------------ persistence helpers
     def _mark_last_updated(self) -> None:
         self.data["last_updated"] = datetime.now().isoformat()
+        self._data_version += 1
 
     def _save_async(self) -> None:
         self._mark_last_updated()
@@ -1311,13 +2123,60 @@ class InventoryApp:
         key = self._normalize_category(value)
         return CATEGORY_LABELS.get(key, key or "앨범")
 
+    def _stock_snapshot(self) -> StockSnapshot:
+        """Return the snapshot for the current data version. Tk thread only."""
+
+        snapshot = self._stock_snapshot_cache
+        if snapshot is None or snapshot.version != self._data_version:
+            snapshot = self._stock_snapshot_cache = StockSnapshot.from_data(self.data, self._data_version)
+        return snapshot
+
+    def _stock_indexes(
+        self, snapshot: Optional[StockSnapshot] = None
+    ) -> Tuple[Dict[Optional[str], Set[str]], Dict[str, Dict[str, Set[str]]], Dict[Tuple[str, str], int]]:
+        """Return (artist -> items, location -> item -> options, (item, option) -> total qty).
+
+        All three are rebuilt in one pass, and only after data changes. The worker thread must
+        pass its ``snapshot``; without one the current snapshot is taken (Tk thread only).
+        """
+
+        if snapshot is None:
+            snapshot = self._stock_snapshot()
+        with self._cache_lock:
+            version, artist_index, location_index, totals = self._stock_index_cache
+        if version != snapshot.version:
+            metadata = snapshot.metadata
+            artist_index = defaultdict(set)
+            location_index = defaultdict(lambda: defaultdict(set))
+            totals = {}
+            for item, item_locations in snapshot.stock.items():
+                artist_index[metadata.get(item, {}).get("artist")].add(item)
+                for option, option_locations in item_locations.items():
+                    totals[(item, option)] = sum(option_locations.values())
+                    for location in option_locations:
+                        location_index[location][item].add(option)
+            # 조회 시 빈 항목이 생기지 않도록 일반 dict로 굳혀 둔다.
+            artist_index = dict(artist_index)
+            location_index = {location: dict(items) for location, items in location_index.items()}
+            with self._cache_lock:
+                if self._stock_index_cache[0] < snapshot.version:
+                    self._stock_index_cache = (snapshot.version, artist_index, location_index, totals)
+        return artist_index, location_index, totals
+
+    def _stock_locations(self) -> Set[str]:
+        """Return every location used in stock, recomputed only after data changes."""
+
+        version, locations = self._stock_locations_cache
+        if version != self._data_version:
+            locations = set(self._stock_indexes()[1])
+            self._stock_locations_cache = (self._data_version, locations)
+        return locations
+
     def _open_location_picker(self) -> None:
         options: Set[str] = set(self.settings.get("location_presets", []))
-        stock = self.data.get("stock", {})
-        for item_locations in stock.values():
-            for option_locations in item_locations.values():
-                options.update(option_locations.keys())
-        sorted_options = sorted(opt for opt in options if opt)
+        options |= self._stock_locations()
+        # 소문자 변환은 한 번만 해 두고 키 입력마다 재사용한다.
+        sorted_options = [(opt, opt.lower()) for opt in sorted(opt for opt in options if opt)]
         win = tk.Toplevel(self.root)
         win.title("로케이션 선택")
         win.geometry("320x360")
@@ -1329,9 +2188,9 @@ class InventoryApp:
         def refresh_list() -> None:
             needle = filter_var.get().strip().lower()
             listbox.delete(0, tk.END)
-            for opt in sorted_options:
-                if not needle or needle in opt.lower():
-                    listbox.insert(tk.END, opt)
+            matches = [opt for opt, lowered in sorted_options if needle in lowered]
+            if matches:
+                listbox.insert(tk.END, *matches)
 
         def choose_from_selection(event=None) -> None:
             if not listbox.curselection():
@@ -1435,7 +2294,7 @@ class InventoryApp:
         ttk.Label(filter_row, text="아티스트 필터").pack(side=tk.LEFT)
         self.artist_filter_var = tk.StringVar(value="")
         self.artist_filter = ttk.Combobox(filter_row, textvariable=self.artist_filter_var, width=25, state="readonly")
-        self.artist_filter.bind("<<ComboboxSelected>>", lambda event: self.refresh_stock())
+        self.artist_filter.bind("<<ComboboxSelected>>", lambda event: self._schedule_refresh_stock())
         self.artist_filter.pack(side=tk.LEFT, padx=8)
         ttk.Button(filter_row, text="초기화", command=self.clear_artist_filter).pack(side=tk.LEFT)
 
@@ -1446,9 +2305,9 @@ class InventoryApp:
         )
         self.category_filter["values"] = ["전체", "앨범", "MD"]
         self.category_filter.current(0)
-        self.category_filter.bind("<<ComboboxSelected>>", lambda _e: self.refresh_stock())
+        self.category_filter.bind("<<ComboboxSelected>>", lambda _e: self._schedule_refresh_stock())
         self.category_filter.pack(side=tk.LEFT, padx=8)
-        ttk.Button(filter_row, text="초기화", command=lambda: self.category_filter_var.set("전체") or self.refresh_stock()).pack(
+        ttk.Button(filter_row, text="초기화", command=lambda: self.category_filter_var.set("전체") or self._schedule_refresh_stock()).pack(
             side=tk.LEFT
         )
 
@@ -1457,7 +2316,7 @@ class InventoryApp:
         self.location_filter = ttk.Combobox(
             filter_row, textvariable=self.location_filter_var, width=20, state="readonly"
         )
-        self.location_filter.bind("<<ComboboxSelected>>", lambda event: self.refresh_stock())
+        self.location_filter.bind("<<ComboboxSelected>>", lambda event: self._schedule_refresh_stock())
         self.location_filter["values"] = ["전체"]
         self.location_filter.current(0)
         self.location_filter.pack(side=tk.LEFT, padx=8)
@@ -1496,7 +2355,8 @@ class InventoryApp:
                 self.stock_tree.column(col, width=0, minwidth=0, stretch=False, anchor=anchor)
             else:
                 self.stock_tree.column(col, width=width, anchor=anchor)
-        self.stock_tree["displaycolumns"] = ("select", "category", "artist", "item", "option", "qty", "location")
+        self._stock_display_columns = ("select", "category", "artist", "item", "option", "qty", "location")
+        self.stock_tree["displaycolumns"] = self._stock_display_columns
         self.stock_tree.tag_configure("negative", foreground="#b91c1c")
         self.stock_tree.tag_configure("audit_recent", foreground="#166534", background="#ecfdf3")
         self.stock_tree.tag_configure("audit_mid", foreground="#92400e", background="#fffbeb")
@@ -1509,7 +2369,7 @@ class InventoryApp:
         self.stock_tree.bind("<Double-1>", lambda event: self.fill_transaction_from_stock())
         self.stock_tree.bind("<Button-1>", self._on_stock_click)
         self.stock_tree.bind("<Motion>", self._on_stock_motion)
-        self.stock_tree.bind("<Leave>", lambda _: self._clear_location_hover())
+        self.stock_tree.bind("<Leave>", self._on_stock_leave)
 
         scrollbar = ttk.Scrollbar(box, orient=tk.VERTICAL, command=self.stock_tree.yview)
         self.stock_tree.configure(yscrollcommand=scrollbar.set)
@@ -1522,7 +2382,8 @@ class InventoryApp:
         action_row = ttk.Frame(box)
         action_row.pack(fill=tk.X, pady=(8, 0))
         ttk.Button(action_row, text="선택 재고 수정", command=self.edit_selected_stock).pack(side=tk.LEFT)
-        ttk.Button(action_row, text="현재 재고 엑셀 저장", command=self.export_stock).pack(side=tk.LEFT, padx=8)
+        self.export_stock_button = ttk.Button(action_row, text="현재 재고 엑셀 저장", command=self.export_stock)
+        self.export_stock_button.pack(side=tk.LEFT, padx=8)
         ttk.Button(action_row, text="선택 재고 삭제", command=self.delete_selected_stock).pack(side=tk.LEFT)
         ttk.Button(action_row, text="재고 실사 모드", command=self.open_stock_audit).pack(side=tk.LEFT, padx=(8, 0))
         ttk.Button(action_row, text="백업 불러오기", command=self.restore_from_backup_file).pack(side=tk.RIGHT)
@@ -1620,24 +2481,82 @@ class InventoryApp:
         nickname = str(self.settings.get("nickname", "")).strip()
         return nickname or "미지정 사용자"
 
-    def _log_user_action(self, action: str, *, persist: bool = False) -> None:
-        entry = {
-            "actor": self._current_actor(),
-            "action": action,
-            "timestamp": datetime.now().isoformat(timespec="seconds"),
-        }
-        log = self.data.setdefault("activity_log", [])
-        log.append(entry)
-        if len(log) > 5000:
-            self.data["activity_log"] = log[-5000:]
-        if persist:
-            self._save_async()
+    def _log_user_action(self, action: str) -> None:
+        self._append_activity(
+            {
+                "actor": self._current_actor(),
+                "action": action,
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+            }
+        )
+
+    def _migrate_legacy_activity_log(self) -> None:
+        """Move activity entries stored in the data file by older versions to the JSONL log, once."""
+
+        legacy = self.data.get("activity_log") or []
+        self.data["activity_log"] = []
+        if not legacy:
+            return
+        # 예전 백업을 복원하면 이미 옮긴 기록이 다시 들어올 수 있으므로 최근 기록에 있는 항목은 건너뛴다.
+        known = {encode_json(entry) for entry in self.activity_log}
+        for entry in legacy:
+            if isinstance(entry, dict) and encode_json(entry) not in known:
+                self._append_activity(entry)
+        # 비운 목록을 바로 저장해야 저장 없이 종료해도 다음 실행에서 같은 기록을 다시 옮기지 않는다.
+        self._save_now()
+
+    def _append_activity(self, entry: Dict[str, str]) -> None:
+        """Append one entry to the activity log file; no full data save is involved."""
+
+        self.activity_log.append(entry)
+        try:
+            if self._activity_log_fp is None:
+                self._activity_log_fp = open(ACTIVITY_LOG_FILE, "a+b")
+                # 이전 실행이 줄 중간에 끊겼다면 새 기록이 그 줄에 붙지 않도록 줄을 바꾼다.
+                if self._activity_log_fp.seek(0, os.SEEK_END) > 0:
+                    self._activity_log_fp.seek(-1, os.SEEK_END)
+                    if self._activity_log_fp.read(1) != b"\n":
+                        self._activity_log_fp.write(b"\n")
+            self._activity_log_fp.write(encode_json(entry) + b"\n")
+            self._activity_log_fp.flush()
+        except OSError:
+            return  # 활동 기록 실패로 본 작업을 막지 않는다.
+        self._activity_log_lines += 1
+        # 매번 자르지 않고 한도의 두 배가 쌓였을 때 최근 기록만 남기고 한 번에 다시 쓴다.
+        if self._activity_log_lines > ACTIVITY_LOG_LIMIT * 2:
+            self._compact_activity_log()
+
+    def _close_activity_log(self) -> None:
+        if self._activity_log_fp is not None:
+            self._activity_log_fp.close()
+            self._activity_log_fp = None
+
+    def _on_root_close(self) -> None:
+        # 대기 중인 저장을 마저 쓰고 작업 스레드를 정리한 뒤 창을 닫는다.
+        self._save_queue.stop()
+        self._stock_pool.shutdown(wait=False, cancel_futures=True)
+        self._close_activity_log()
+        self.root.destroy()
+
+    def _compact_activity_log(self) -> None:
+        self._close_activity_log()
+        try:
+            atomic_write_chunks(ACTIVITY_LOG_FILE, (encode_json(entry) + b"\n" for entry in self.activity_log))
+        except OSError:
+            return
+        self._activity_log_lines = len(self.activity_log)
 
     @staticmethod
     def _format_location_detail(locations: Dict[str, int]) -> str:
-        if not locations:
+        return InventoryApp._format_sorted_locations(sorted(locations.items()))
+
+    @staticmethod
+    def _format_sorted_locations(items: Iterable[Tuple[str, int]]) -> str:
+        """Format (location, qty) pairs that are already sorted by location."""
+
+        parts = [f"{loc}({qty:,})" for loc, qty in items]
+        if not parts:
             return "-"
-        parts = [f"{loc}({qty:,})" for loc, qty in sorted(locations.items())]
         if len(parts) == 1:
             return parts[0]
         return f"{len(parts)}곳: " + ", ".join(parts)
@@ -1652,13 +2571,12 @@ class InventoryApp:
         self.history_end_var.set(end)
         self.history_artist_var.set("전체")
         self.history_event_filter = False
-        self.search_history("in", triggered_by_calendar=True)
-        self.search_history("out", triggered_by_calendar=True)
-        self.search_history("in", triggered_by_calendar=True)
+        self._search_history_both(show="in")
 
     def reload_data(self) -> None:
         self.data = load_data()
-        self._activity_cache = {}
+        self._data_version += 1
+        self._migrate_legacy_activity_log()
         self.history_cache = {"in": [], "out": []}
         self.history_indices = {"in": [], "out": []}
         self.current_history_type = "in"
@@ -1688,11 +2606,11 @@ class InventoryApp:
         except Exception as exc:  # pragma: no cover - UI feedback path
             messagebox.showerror("오류", f"백업 불러오기 실패: {exc}")
             return
+        self._data_version += 1
+        self._migrate_legacy_activity_log()
         self._refresh_artist_options()
         self.refresh_stock()
-        self.search_history("in", triggered_by_calendar=True)
-        self.search_history("out", triggered_by_calendar=True)
-        self.search_history(self.current_history_type or "in", triggered_by_calendar=True)
+        self._search_history_both(show=self.current_history_type or "in")
         self.set_status("백업을 불러왔습니다.")
 
     def _open_location_map_editor(self) -> None:
@@ -1704,14 +2622,25 @@ class InventoryApp:
             return
         LocationMapEditor(self.root, LOCATION_MAP_FILE)
 
+    def _sorted_artists(self) -> List[str]:
+        """Return the sorted artist names from item metadata, recomputed only after data changes."""
+
+        version, artists = self._sorted_artists_cache
+        if version != self._data_version:
+            metadata = self.data.get("item_metadata", {})
+            artists = sorted({info.get("artist") for info in metadata.values() if info.get("artist")})
+            self._sorted_artists_cache = (self._data_version, artists)
+        return artists
+
     def _refresh_artist_options(self) -> None:
-        metadata = self.data.get("item_metadata", {})
-        artists = sorted({info.get("artist") for info in metadata.values() if info.get("artist")})
-        self.artist_filter["values"] = ["전체"] + artists if artists else ["전체"]
+        options = ["전체"] + self._sorted_artists()
+        if options != self._artist_filter_options:
+            self._artist_filter_options = options
+            self.artist_filter["values"] = options
+            if hasattr(self, "history_artist_combo"):
+                self.history_artist_combo["values"] = options
         self.artist_filter.current(0)
         if hasattr(self, "history_artist_combo"):
-            options = ["전체"] + artists if artists else ["전체"]
-            self.history_artist_combo["values"] = options
             if self.history_artist_var.get() not in options:
                 self.history_artist_var.set("전체")
             if not self.history_artist_combo.get():
@@ -1721,9 +2650,10 @@ class InventoryApp:
         if not hasattr(self, "location_filter"):
             return
         options = ["전체"] + [loc for loc in locations if loc]
-        current = self.location_filter_var.get()
-        self.location_filter["values"] = options if options else ["전체"]
-        if current not in self.location_filter["values"]:
+        if options != self._location_filter_options:
+            self._location_filter_options = options
+            self.location_filter["values"] = options
+        if self.location_filter_var.get() not in options:
             self.location_filter.current(0)
 
     def _apply_location_presets(self) -> None:
@@ -1741,51 +2671,69 @@ class InventoryApp:
 
     def clear_artist_filter(self) -> None:
         self.artist_filter.current(0)
-        self.refresh_stock()
+        self._schedule_refresh_stock()
 
     def clear_location_filter(self) -> None:
         if hasattr(self, "location_filter"):
             if self.location_filter["values"]:
                 self.location_filter.current(0)
-        self.refresh_stock()
+        self._schedule_refresh_stock()
 
-    def _audit_status_for_row(self, item: str, option: str, locations: Dict[str, int]) -> Tuple[str, str, bool]:
+    def _audit_status_for_row(
+        self,
+        item: str,
+        option: str,
+        locations: Dict[str, int],
+        today: Optional[date] = None,
+        snapshot: Optional[StockSnapshot] = None,
+    ) -> Tuple[str, str, bool]:
         """Return (label, tag, partial) for the last audit time of the given item/option across locations."""
 
-        metadata = self.data.get("item_metadata", {})
+        today = today or date.today()
+        if snapshot is None:
+            snapshot = self._stock_snapshot()
+        # 같은 데이터 버전·같은 날짜 안에서는 결과가 바뀌지 않으므로 한 번만 계산한다.
+        key = (item, option, frozenset(locations))
+        with self._cache_lock:
+            version, day, cache = self._audit_cache
+            status = cache.get(key) if version == snapshot.version and day == today else None
+        if status is not None:
+            return status
+        status = self._compute_audit_status(item, option, locations, today, snapshot.metadata)
+        with self._cache_lock:
+            version, day, current = self._audit_cache
+            if version == snapshot.version and day == today:
+                current[key] = status
+            elif version <= snapshot.version:
+                self._audit_cache = (snapshot.version, today, {key: status})
+        return status
+
+    def _compute_audit_status(
+        self, item: str, option: str, locations: Dict[str, int], today: date, metadata: Dict[str, Dict]
+    ) -> Tuple[str, str, bool]:
         info = metadata.get(item, {}) if isinstance(metadata.get(item, {}), dict) else {}
         audits = info.get("last_audit", {}) if isinstance(info.get("last_audit", {}), dict) else {}
 
         option_key = option or ""
         # 전체 범위가 기록된 경우 우선 사용
-        all_key = f"{option_key}::__all__"
-        ts_str: Optional[str] = audits.get(all_key)
+        all_value = audits.get(f"{option_key}::__all__")
         partial = False
-
-        # 개별 로케이션 실사 시간이 있으면 그것도 집계
-        per_location_dates: Dict[str, date] = {}
-        if not ts_str:
+        if all_value:
+            ts = _parse_iso_date(str(all_value))
+        else:
+            # 개별 로케이션 실사 시간이 있으면 그것도 집계
+            per_location_dates: List[date] = []
             for loc in locations:
-                loc_key = f"{option_key}::{loc}"
-                if loc_key in audits:
-                    try:
-                        per_location_dates[loc] = datetime.fromisoformat(str(audits[loc_key])).date()
-                    except Exception:
-                        continue
-            if per_location_dates:
-                ts = max(per_location_dates.values())
-                ts_str = ts.isoformat()
-                partial = len(per_location_dates) < len(locations)
-
-        if not ts_str:
+                value = audits.get(f"{option_key}::{loc}")
+                parsed = _parse_iso_date(str(value)) if value is not None else None
+                if parsed is not None:
+                    per_location_dates.append(parsed)
+            ts = max(per_location_dates) if per_location_dates else None
+            partial = bool(per_location_dates) and len(per_location_dates) < len(locations)
+
+        if ts is None:
             return "미실사", "audit_old", False
 
-        try:
-            ts = datetime.fromisoformat(str(ts_str)).date()
-        except Exception:
-            return "미실사", "audit_old", partial
-
-        today = date.today()
         days = max(0, (today - ts).days)
         if days < 30:
             label = f"{days}일"
@@ -1806,116 +2754,255 @@ class InventoryApp:
         audits = info.setdefault("last_audit", {})
         option_key = option or ""
         audits[f"{option_key}::{scope}"] = datetime.now().date().isoformat()
+        self._data_version += 1
 
     def _record_last_audit_for_row(self, row: Dict[str, object], scope: Optional[str] = None) -> None:
         target_scope = scope or row.get("audit_scope") or "__all__"
         self._record_last_audit(row.get("item", ""), row.get("option", ""), target_scope)
 
-    def refresh_stock(self) -> None:
-        rows = self._generate_stock_rows()
-        self.stock_rows = []
+    def _schedule_refresh_stock(self) -> None:
+        """Coalesce filter changes arriving within _FILTER_DEBOUNCE_MS into one refresh_stock call."""
+
+        if self._refresh_stock_job is not None:
+            self.root.after_cancel(self._refresh_stock_job)
+        self._refresh_stock_job = self.root.after(_FILTER_DEBOUNCE_MS, self.refresh_stock)
+
+    def refresh_stock(self, *, wait: bool = False) -> None:
+        """Rebuild the stock table; uncached rows are computed on a worker thread unless ``wait``."""
+
+        if self._refresh_stock_job is not None:
+            self.root.after_cancel(self._refresh_stock_job)
+            self._refresh_stock_job = None
+        filters = self._stock_row_filters()
+        # 실사 경과일 라벨이 날짜에 따라 바뀌므로 오늘 날짜도 키에 넣는다.
+        cache_key = filters + (date.today(), self._data_version)
+        self._refresh_token = token = next(self._refresh_tokens)
+        rows = self._stock_rows_cache.get(cache_key)
+        if rows is not None:
+            self._stock_rows_cache.move_to_end(cache_key)
+        elif wait:
+            rows = self._generate_stock_rows(self._stock_snapshot(), *filters)
+            self._remember_stock_rows(cache_key, rows)
+        else:
+            # 작업 스레드는 UI 스레드가 고치는 self.data 대신 이 버전의 스냅샷만 읽는다.
+            future = self._stock_pool.submit(self._generate_stock_rows, self._stock_snapshot(), *filters)
+            self.root.after(_STOCK_POLL_MS, self._poll_stock_rows, future, token, cache_key)
+            return
+        self._apply_stock_rows(rows)
+
+    def _poll_stock_rows(self, future, token: int, cache_key: tuple) -> None:
+        if token != self._refresh_token:
+            return  # 그 사이 새 요청이 들어왔으면 이 결과는 버린다.
+        if not future.done():
+            self.root.after(_STOCK_POLL_MS, self._poll_stock_rows, future, token, cache_key)
+            return
+        if cache_key[-1] != self._data_version:
+            self.refresh_stock()
+            return
+        rows = future.result()
+        self._remember_stock_rows(cache_key, rows)
+        self._apply_stock_rows(rows)
+
+    def _remember_stock_rows(self, cache_key: tuple, rows: List[Dict[str, object]]) -> None:
+        self._stock_rows_cache[cache_key] = rows
+        if len(self._stock_rows_cache) > _STOCK_ROWS_CACHE_SIZE:
+            self._stock_rows_cache.popitem(last=False)
+
+    def _apply_stock_rows(self, rows: List[Dict[str, object]]) -> None:
+        render_pending = self._cancel_stock_render()
+        # 표시용 행을 만드는 같은 반복에서 내보내기용 열(StockTable)도 함께 채운다.
+        table = StockTable()
+        view_rows: List[Tuple[str, Tuple, List[str]]] = []
         self.stock_row_lookup = {row["id"]: row for row in rows}
         self.checked_stock_ids &= set(self.stock_row_lookup)
-        for row_id in self.stock_tree.get_children():
-            self.stock_tree.delete(row_id)
+        # 행마다 반복되는 메서드 호출을 줄이기 위해 바운드 메서드와 라벨을 미리 잡아 둔다.
+        checked = self.checked_stock_ids
+        fmt = "{:,}".format
+        category_labels: Dict[str, str] = {}
         for idx, row in enumerate(rows):
-            audit_label = row.get("audit_label", "미실사")
-            if row.get("audit_partial"):
+            # _generate_stock_rows가 모든 키를 채워 주므로 한 번에 꺼낸다.
+            (
+                row_id, category, artist, item, option, opening, in_total, out_total, qty,
+                audit_label, audit_tag, audit_partial,
+            ) = _STOCK_ROW_FIELDS(row)
+            if audit_partial:
                 audit_label = f"{audit_label} ⚠"
-            category_label = self._category_label(row.get("category", "album"))
+            category_label = category_labels.get(category)
+            if category_label is None:
+                category_label = category_labels[category] = self._category_label(category)
             values = (
-                "☑" if row["id"] in self.checked_stock_ids else "☐",
+                "☑" if row_id in checked else "☐",
                 audit_label,
                 category_label,
-                row["artist"],
-                row["item"],
-                row["option"] or "-",
-                self._format_quantity(row["opening"]),
-                self._format_quantity(row["in_total"]),
-                self._format_quantity(row["out_total"]),
-                self._format_quantity(row["qty"]),
+                artist,
+                item,
+                option or "-",
+                fmt(opening),
+                fmt(in_total),
+                fmt(out_total),
+                fmt(qty),
                 "로케이션 확인",
             )
-            tags = {"even" if idx % 2 == 0 else "odd"}
-            if row["qty"] <= 0:
-                tags.add("negative")
-            if row.get("audit_tag"):
-                tags.add(row["audit_tag"])
-            if row.get("audit_partial"):
-                tags.add("audit_partial")
-            self.stock_tree.insert("", tk.END, iid=row["id"], values=values, tags=list(tags))
-            self.stock_rows.append(
-                (
-                    category_label,
-                    row["artist"],
-                    row["item"],
-                    row["option"],
-                    row["opening"],
-                    row["in_total"],
-                    row["out_total"],
-                    row["qty"],
-                    audit_label,
-                    row["location_display"],
-                )
-            )
+            # 서명 비교가 흔들리지 않도록 태그 순서를 고정한다.
+            tags = ["even" if idx % 2 == 0 else "odd"]
+            if qty <= 0:
+                tags.append("negative")
+            if audit_tag:
+                tags.append(audit_tag)
+            if audit_partial:
+                tags.append("audit_partial")
+            view_rows.append((row_id, values, tags))
+            table.categories.append(category_label)
+            table.artists.append(artist)
+            table.items.append(item)
+            table.options.append(option)
+            table.openings.append(opening)
+            table.in_totals.append(in_total)
+            table.out_totals.append(out_total)
+            table.qtys.append(qty)
+            table.audits.append(audit_label)
+            table.locations.append(row["location_display"])
+        # 새로고침마다 새 테이블을 만들고 고치지 않으므로 내보내기 스레드와 그대로 공유해도 된다.
+        self.stock_table = table
+        self._stock_view_rows = view_rows
+        if render_pending or not self._stock_row_signatures:
+            self._rebuild_stock_tree()
+        else:
+            self._patch_stock_tree(view_rows)
+
+    def _rebuild_stock_tree(self) -> None:
+        self.stock_tree.delete(*self.stock_tree.get_children())
+        self._stock_row_signatures = {}
+        # 첫 화면에 보이는 만큼만 바로 넣고, 나머지는 이벤트 루프 사이사이에 나눠서 넣는다.
+        self._render_stock_rows(0, int(self.stock_tree.cget("height")) * 2)
+
+    def _patch_stock_tree(self, view_rows: List[Tuple[str, Tuple, List[str]]]) -> None:
+        """Bring the tree in line with ``view_rows`` touching only rows that changed."""
+
+        tree = self.stock_tree
+        call = tree.tk.call
+        widget = tree._w
+        old = self._stock_row_signatures
+        new = {iid: (values, tags) for iid, values, tags in view_rows}
+        removed = [iid for iid in old if iid not in new]
+        if removed:
+            tree.delete(*removed)
+        # 남아 있는 행의 상대 순서가 그대로면 move 없이 새 행만 제자리에 끼워 넣는다.
+        reordered = list(tree.get_children()) != [iid for iid, _values, _tags in view_rows if iid in old]
+        for index, (iid, values, tags) in enumerate(view_rows):
+            if iid not in old:
+                call(widget, "insert", "", index, "-id", iid, "-values", values, "-tags", tags)
+                continue
+            if old[iid] != (values, tags):
+                call(widget, "item", iid, "-values", values, "-tags", tags)
+            if reordered:
+                call(widget, "move", iid, "", index)
+        self._stock_row_signatures = new
+
+    def _render_stock_rows(self, start: int, stop: int) -> None:
+        self._stock_render_job = None
+        rows = self._stock_view_rows
+        # ttk.Treeview.insert의 옵션 변환을 건너뛰고 Tcl 명령을 바로 호출한다.
+        # 튜플/리스트는 tkinter가 Tcl 리스트로 그대로 넘겨 준다.
+        call = self.stock_tree.tk.call
+        widget = self.stock_tree._w
+        signatures = self._stock_row_signatures
+        # 줄무늬 태그만 달아 넣고, 나머지 태그는 태그마다 한 번의 "tag add"로 몰아서 붙인다.
+        tagged: Dict[str, List[str]] = defaultdict(list)
+        for iid, values, tags in rows[start:stop]:
+            call(widget, "insert", "", "end", "-id", iid, "-values", values, "-tags", tags[0])
+            for tag in tags[1:]:
+                tagged[tag].append(iid)
+            signatures[iid] = (values, tags)
+        for tag, ids in tagged.items():
+            call(widget, "tag", "add", tag, ids)
+        if stop < len(rows):
+            self._stock_render_job = self.root.after(1, self._render_stock_rows, stop, stop + _STOCK_RENDER_CHUNK)
+
+    def _cancel_stock_render(self) -> bool:
+        if self._stock_render_job is None:
+            return False
+        self.root.after_cancel(self._stock_render_job)
+        self._stock_render_job = None
+        return True
 
     def _on_stock_click(self, event) -> Optional[str]:
         region = self.stock_tree.identify("region", event.x, event.y)
         if region != "cell":
             return None
-        column = self.stock_tree.identify_column(event.x)
         row_id = self.stock_tree.identify_row(event.y)
+        col_name = self._stock_column_name(self.stock_tree.identify_column(event.x))
+        if col_name == "select" and row_id:
+            self._toggle_stock_checkbox(row_id)
+            return "break"
+        if col_name == "location" and row_id:
+            self.open_location_overview(row_id)
+            return "break"
+        return None
+
+    def _stock_column_name(self, column: str) -> Optional[str]:
+        """Map an identify_column result ("#3") to the displayed column name."""
+
         try:
             col_index = int(column.lstrip("#")) - 1
         except ValueError:
             return None
-        display_cols = list(self.stock_tree["displaycolumns"])
-        if 0 <= col_index < len(display_cols):
-            col_name = display_cols[col_index]
-            if col_name == "select" and row_id:
-                self._toggle_stock_checkbox(row_id)
-                return "break"
-            if col_name == "location" and row_id:
-                self.open_location_overview(row_id)
-                return "break"
+        if 0 <= col_index < len(self._stock_display_columns):
+            return self._stock_display_columns[col_index]
         return None
 
     def _on_stock_motion(self, event) -> None:
-        region = self.stock_tree.identify("region", event.x, event.y)
-        column = self.stock_tree.identify_column(event.x)
-        row_id = self.stock_tree.identify_row(event.y)
-        if region == "cell" and row_id:
-            try:
-                col_index = int(column.lstrip("#")) - 1
-            except ValueError:
+        # 마우스 이동이 몰려 와도 유휴 시점에 마지막 좌표로 한 번만 처리한다.
+        self._stock_motion_xy = (event.x, event.y)
+        if self._stock_motion_job is None:
+            self._stock_motion_job = self.root.after_idle(self._apply_stock_motion)
+
+    def _apply_stock_motion(self) -> None:
+        self._stock_motion_job = None
+        x, y = self._stock_motion_xy
+        tree = self.stock_tree
+        row_id = tree.identify_row(y)
+        on_location = bool(row_id) and (
+            tree.identify("region", x, y) == "cell" and self._stock_column_name(tree.identify_column(x)) == "location"
+        )
+        if on_location:
+            if self._hover_location_row != row_id:
                 self._clear_location_hover()
-                self.stock_tree.configure(cursor="")
-                return
-            display_cols = list(self.stock_tree["displaycolumns"])
-            if 0 <= col_index < len(display_cols) and display_cols[col_index] == "location":
-                if self._hover_location_row != row_id:
-                    self._clear_location_hover()
-                    self._hover_location_row = row_id
-                    tags = set(self.stock_tree.item(row_id, "tags"))
-                    tags.add("location_hover")
-                    self.stock_tree.item(row_id, tags=list(tags))
-                self.stock_tree.configure(cursor="hand2")
-                return
+                self._hover_location_row = row_id
+                tree.item(row_id, tags=self._stock_row_tags(row_id) + ["location_hover"])
+        else:
+            self._clear_location_hover()
+        cursor = "hand2" if on_location else ""
+        if cursor != self._stock_cursor:
+            self._stock_cursor = cursor
+            tree.configure(cursor=cursor)
+
+    def _on_stock_leave(self, _event=None) -> None:
+        if self._stock_motion_job is not None:
+            self.root.after_cancel(self._stock_motion_job)
+            self._stock_motion_job = None
         self._clear_location_hover()
-        self.stock_tree.configure(cursor="")
+
+    def _stock_row_tags(self, row_id: str) -> List[str]:
+        """Return the row's own tags (without hover), from the render signature when available."""
+
+        signature = self._stock_row_signatures.get(row_id)
+        if signature is not None:
+            return list(signature[1])
+        return [tag for tag in self.stock_tree.item(row_id, "tags") if tag != "location_hover"]
 
     def _clear_location_hover(self) -> None:
-        if not getattr(self, "_hover_location_row", None):
-            return
         row_id = self._hover_location_row
-        tags = set(self.stock_tree.item(row_id, "tags"))
-        if "location_hover" in tags:
-            tags.remove("location_hover")
-            self.stock_tree.item(row_id, tags=list(tags))
+        if not row_id:
+            return
         self._hover_location_row = None
+        try:
+            self.stock_tree.item(row_id, tags=self._stock_row_tags(row_id))
+        except tk.TclError:
+            pass  # 새로고침으로 이미 사라진 행
 
     def _choose_locations(self, row: Dict[str, object], *, multiple: bool) -> Optional[object]:
-        locations = sorted((row.get("locations") or {}).keys())
+        locations = [loc for loc, _qty in row.get("locations_sorted", ())]
         if not locations:
             messagebox.showinfo("안내", "선택한 품목의 로케이션 정보를 찾을 수 없습니다.")
             return None
@@ -1970,7 +3057,7 @@ class InventoryApp:
         if not option_map:
             messagebox.showinfo("안내", "해당 품목의 로케이션 정보를 찾을 수 없습니다.")
             return
-        total_qty = sum(option_map.values())
+        total_qty = self._stock_indexes()[2].get((row["item"], row["option"]), 0)
         top = tk.Toplevel(self.root)
         top.title("로케이션 확인")
         top.transient(self.root)
@@ -2055,59 +3142,86 @@ class InventoryApp:
         else:
             self.checked_stock_ids.add(row_id)
         if row_id in self.stock_row_lookup:
-            row = self.stock_row_lookup[row_id]
-            values = (
-                "☑" if row_id in self.checked_stock_ids else "☐",
-                row["artist"],
-                row["item"],
-                row["option"] or "-",
-                self._format_quantity(row["opening"]),
-                self._format_quantity(row["in_total"]),
-                self._format_quantity(row["out_total"]),
-                self._format_quantity(row["qty"]),
-                "로케이션 확인",
-            )
-            self.stock_tree.item(row_id, values=values)
+            # 바뀐 것은 선택 칸뿐이므로 그 셀만 고친다.
+            mark = "☑" if row_id in self.checked_stock_ids else "☐"
+            self.stock_tree.set(row_id, "select", mark)
+            signature = self._stock_row_signatures.get(row_id)
+            if signature is not None:
+                values, tags = signature
+                self._stock_row_signatures[row_id] = ((mark,) + tuple(values[1:]), tags)
+
+    def _stock_row_filters(self) -> Tuple[str, str, str, Optional[str]]:
+        """Read the stock filters on the Tk thread, refreshing the location choices first."""
 
-    def _generate_stock_rows(self) -> List[Dict[str, object]]:
-        stock = self.data.get("stock", {})
-        metadata = self.data.get("item_metadata", {})
         selection = self.artist_filter_var.get()
         category_choice = getattr(self, "category_filter_var", tk.StringVar(value="전체")).get()
+        location_pool: Set[str] = set(self.settings.get("location_presets", []))
+        location_pool |= self._stock_locations()
+        self._refresh_location_filter_options(sorted(location_pool))
         location_selection = getattr(self, "location_filter_var", tk.StringVar(value="전체")).get()
+        return selection, category_choice, location_selection, self.data.get("current_period")
+
+    def _generate_stock_rows(
+        self,
+        snapshot: StockSnapshot,
+        selection: str,
+        category_choice: str,
+        location_selection: str,
+        period: Optional[str],
+    ) -> List[Dict[str, object]]:
+        """Build the stock rows for the given filters from ``snapshot``.
+
+        Touches neither Tk state nor ``self.data``, so it may run off-thread.
+        """
+
+        stock = snapshot.stock
+        metadata = snapshot.metadata
+        artist_index, location_index, totals = self._stock_indexes(snapshot)
         filtered_stock = stock
         if selection and selection != "전체":
-            filtered_stock = filter_stock_by_artist(stock, metadata, selection)
+            filtered_stock = {item: stock[item] for item in artist_index.get(selection, ())}
 
         category_key = self._normalize_category(category_choice) if category_choice and category_choice != "전체" else None
 
-        location_pool: Set[str] = set(self.settings.get("location_presets", []))
-        for item_locations in stock.values():
-            for option_locations in item_locations.values():
-                location_pool.update(option_locations.keys())
-        self._refresh_location_filter_options(sorted(location_pool))
-        location_selection = getattr(self, "location_filter_var", tk.StringVar(value="전체")).get()
-
-        period = self.data.get("current_period")
         opening = {}
         if period:
-            opening = self.data.get("periods", {}).get(period, {}).get("opening_stock", {})
-        activity = self._calculate_period_activity(period, location_selection)
+            opening = snapshot.periods.get(period, {}).get("opening_stock", {})
+        activity = self._calculate_period_activity(snapshot, period, location_selection)
+        today = date.today()
         rows: List[Dict[str, object]] = []
-        for item in sorted(filtered_stock):
-            category_value = self._normalize_category(metadata.get(item, {}).get("category", "album"))
+        # 로케이션 필터가 있으면 해당 로케이션에 등록된 품목/옵션만 훑는다.
+        location_options = None
+        candidates = filtered_stock
+        if location_selection and location_selection != "전체":
+            location_options = location_index.get(location_selection, {})
+            candidates = [item for item in location_options if item in filtered_stock]
+        # 결과는 아래에서 (구분, 아티스트, 품목, 옵션, …) 순으로 정렬하고 (품목, 옵션)이 겹치지 않으므로
+        # 순회 순서는 결과에 영향이 없다. 품목/옵션 키를 따로 정렬하지 않는다.
+        labels: Dict[str, str] = {}
+        for item in candidates:
+            item_meta = metadata.get(item, {})
+            category_value = self._normalize_category(item_meta.get("category", "album"))
             if category_key and category_value != category_key:
                 continue
-            for option in sorted(filtered_stock[item]):
+            artist = item_meta.get("artist") or "-"
+            # 구분 값은 몇 가지뿐이므로 라벨을 한 번씩만 만든다.
+            category_label = labels.get(category_value)
+            if category_label is None:
+                category_label = labels[category_value] = self._category_label(category_value)
+            options = location_options[item] if location_options is not None else filtered_stock[item]
+            for option in options:
                 all_locations = filtered_stock[item][option]
+                # 정렬된 로케이션 목록은 행마다 한 번만 만들고 표시·실사·내보내기에서 같이 쓴다.
+                locations_sorted = tuple(sorted(all_locations.items()))
                 if location_selection and location_selection != "전체":
-                    locations = {location_selection: all_locations.get(location_selection, 0)}
-                    if sum(locations.values()) == 0:
+                    total_qty = all_locations.get(location_selection, 0)
+                    if total_qty == 0:
                         continue
+                    locations = {location_selection: total_qty}
                 else:
                     locations = all_locations
+                    total_qty = totals[(item, option)]
 
-                total_qty = sum(locations.values())
                 opening_map = opening.get(item, {}).get(option, {})
                 if location_selection and location_selection != "전체":
                     opening_total = opening_map.get(location_selection, 0)
@@ -2115,18 +3229,18 @@ class InventoryApp:
                     audit_scope = location_selection
                 else:
                     opening_total = sum(opening_map.values())
-                    location_display = self._format_location_detail(locations)
+                    location_display = self._format_sorted_locations(locations_sorted)
                     audit_scope = "__all__"
 
                 metrics = activity.get((item, option), {"in": 0, "out": 0})
-                audit_label, audit_tag, audit_partial = self._audit_status_for_row(item, option, locations)
+                audit_label, audit_tag, audit_partial = self._audit_status_for_row(item, option, locations, today, snapshot)
                 rows.append(
                     {
                         "id": f"{item}::{option}"
                         if location_selection == "전체" or not location_selection
                         else f"{item}::{option}::{location_selection}",
                         "category": category_value,
-                        "artist": metadata.get(item, {}).get("artist") or "-",
+                        "artist": artist,
                         "item": item,
                         "option": option,
                         "location_display": location_display,
@@ -2135,50 +3249,82 @@ class InventoryApp:
                         "in_total": metrics.get("in", 0),
                         "out_total": metrics.get("out", 0),
                         "qty": total_qty,
-                        "locations": deepcopy(all_locations),
+                        # 값이 int뿐이라 얕은 복사로 충분하다(표시 중인 행이 이후 변경에 흔들리지 않게만 한다).
+                        "locations": all_locations.copy(),
+                        "locations_sorted": locations_sorted,
                         "audit_label": audit_label,
                         "audit_tag": audit_tag,
                         "audit_scope": audit_scope,
                         "audit_partial": audit_partial and len(locations) > 1,
+                        # 정렬 키를 만들 때 한 번만 계산해 두고 비교는 튜플끼리 C 수준에서 한다.
+                        "_sort_key": (category_label, artist, item, option, location_display),
                     }
                 )
-        rows.sort(
-            key=lambda r: (
-                self._category_label(r.get("category")),
-                r.get("artist") or "",
-                r.get("item") or "",
-                r.get("option") or "",
-                r.get("location_display") or "",
-            )
-        )
+        rows.sort(key=_ROW_SORT_KEY)
         return rows
 
-    def _calculate_period_activity(self, period: Optional[str], location_filter: str = "전체") -> Dict[Tuple[str, str], Dict[str, int]]:
-        history = self.data.get("history", [])
-        cache_key = (period or "", location_filter or "전체", len(history), self.data.get("last_updated"))
-        if cache_key in self._activity_cache:
-            return self._activity_cache[cache_key]
+    def _calculate_period_activity(
+        self, snapshot: StockSnapshot, period: Optional[str], location_filter: str = "전체"
+    ) -> Dict[Tuple[str, str], Dict[str, int]]:
+        cache_key = (period or "", location_filter or "전체", snapshot.version)
+        with self._cache_lock:
+            cached = self._activity_cache.get(cache_key)
+            if cached is not None:
+                self._activity_cache.move_to_end(cache_key)
+                return cached
 
         activity: Dict[Tuple[str, str], Dict[str, int]] = {}
         if not period:
             return activity
-        for entry in history:
-            if entry.get("period") != period:
-                continue
-            if location_filter and location_filter != "전체":
-                if entry.get("location") != location_filter:
-                    continue
-            key = (entry.get("item"), entry.get("option", ""))
-            if not key[0]:
-                continue
-            tracker = activity.setdefault(key, {"in": 0, "out": 0})
-            tx_type = entry.get("type")
-            if tx_type not in ("in", "out"):
-                continue
-            tracker[tx_type] = tracker.get(tx_type, 0) + entry.get("quantity", 0)
-        self._activity_cache[cache_key] = activity
+        by_period, by_period_location = self._history_totals(snapshot)
+        if location_filter and location_filter != "전체":
+            totals = by_period_location.get((period, location_filter), {})
+        else:
+            totals = by_period.get(period, {})
+        # 입고/출고 합계를 (품목, 옵션)별 {"in", "out"} 형태로 한 번에 펼친다.
+        for (item, option, tx_type), quantity in totals.items():
+            tracker = activity.get((item, option))
+            if tracker is None:
+                tracker = activity[(item, option)] = {"in": 0, "out": 0}
+            tracker[tx_type] = quantity
+        with self._cache_lock:
+            self._activity_cache[cache_key] = activity
+            if len(self._activity_cache) > _ACTIVITY_CACHE_SIZE:
+                self._activity_cache.popitem(last=False)
         return activity
 
+    def _history_totals(
+        self, snapshot: StockSnapshot
+    ) -> Tuple[Dict[Optional[str], Counter], Dict[Tuple[Optional[str], Optional[str]], Counter]]:
+        """Return in/out quantity totals keyed by (item, option, type), per period and per (period, location).
+
+        Built in a single pass over history, and only after data changes.
+        """
+
+        with self._cache_lock:
+            version, by_period, by_period_location = self._history_totals_cache
+        if version != snapshot.version:
+            by_period = defaultdict(Counter)
+            by_period_location = defaultdict(Counter)
+            for entry in snapshot.history:
+                tx_type = entry.get("type")
+                if tx_type not in ("in", "out"):
+                    continue
+                item = entry.get("item")
+                if not item:
+                    continue
+                period = entry.get("period")
+                key = (item, entry.get("option", ""), tx_type)
+                quantity = entry.get("quantity", 0)
+                by_period[period][key] += quantity
+                by_period_location[(period, entry.get("location"))][key] += quantity
+            by_period = dict(by_period)
+            by_period_location = dict(by_period_location)
+            with self._cache_lock:
+                if self._history_totals_cache[0] < snapshot.version:
+                    self._history_totals_cache = (snapshot.version, by_period, by_period_location)
+        return by_period, by_period_location
+
     def _default_history_range(self) -> Tuple[str, str]:
         today = date.today()
         start = (today - timedelta(days=29)).isoformat()
@@ -2202,20 +3348,18 @@ class InventoryApp:
         if not cleaned:
             return date.today()
         try:
+            if _DAY_RE.fullmatch(cleaned):
+                return date.fromisoformat(cleaned)
+            # 0을 채우지 않은 연-월-일(2024-5-1)은 드물어서 느린 strptime에 맡긴다.
             return datetime.strptime(cleaned, "%Y-%m-%d").date()
         except ValueError:
             pass
-        normalized = cleaned.replace(".", "/")
-        for sep in ("/", "-"):
-            if sep in normalized:
-                parts = [p for p in normalized.split(sep) if p]
-                if len(parts) == 2:
-                    try:
-                        month = int(parts[0])
-                        day = int(parts[1])
-                        return date(datetime.now().year, month, day)
-                    except ValueError:
-                        continue
+        match = _MONTH_DAY_RE.fullmatch(cleaned)
+        if match:
+            try:
+                return date(date.today().year, int(match.group(1)), int(match.group(2)))
+            except ValueError:
+                pass
         raise ValueError("날짜 형식을 인식할 수 없습니다. 예: 2024-05-01 또는 11/20")
 
     def open_tx_calendar(self) -> None:
@@ -2240,8 +3384,7 @@ class InventoryApp:
 
     def _on_history_date(self, target_var: tk.StringVar, selected: date) -> None:
         target_var.set(selected.isoformat())
-        self.search_history("in", triggered_by_calendar=True)
-        self.search_history("out", triggered_by_calendar=True)
+        self._schedule_history_refresh(show="out")
 
     def fill_transaction_from_stock(self) -> None:
         selection = self.stock_tree.selection()
@@ -2331,12 +3474,13 @@ class InventoryApp:
             if not option_map:
                 stock.pop(row["item"], None)
                 metadata.pop(row["item"], None)
+        invalidate_item_totals(self.data)
         self._save_async()
         self.checked_stock_ids.clear()
         self._refresh_artist_options()
         self.refresh_stock()
         self.set_status("선택한 재고를 삭제했습니다.")
-        self._log_user_action("선택 재고 삭제", persist=False)
+        self._log_user_action("선택 재고 삭제")
 
     def open_stock_audit(self) -> None:
         if self.audit_window and self.audit_window.winfo_exists():
@@ -2344,7 +3488,8 @@ class InventoryApp:
             self.audit_window.focus()
             return
 
-        self.refresh_stock()
+        # 실사 창은 곧바로 stock_row_lookup을 읽으므로 계산이 끝날 때까지 기다린다.
+        self.refresh_stock(wait=True)
         self.audit_counts = {}
         self.audit_entry_map = {}
         self.audit_count_var.set("")
@@ -2411,26 +3556,32 @@ class InventoryApp:
         tree = self.audit_tree
         tree.delete(*tree.get_children())
         self.audit_entry_map = {}
-        insert_idx = 0
+        entries: List[Tuple[str, Tuple, List[str]]] = []
         for row_id, row in self.stock_row_lookup.items():
             locations = row.get("locations", {})
             # 단일 로케이션 또는 필터링된 경우
             if len(locations) <= 1:
                 loc = next(iter(locations)) if locations else ""
                 entry_id = row_id if not loc else f"{row_id}::{loc}"
-                self._insert_audit_entry(tree, entry_id, row, loc, row.get("qty", 0), insert_idx)
-                insert_idx += 1
+                entries.append(self._audit_entry(entry_id, row, loc, row.get("qty", 0), len(entries)))
                 continue
 
             # 복수 로케이션은 각각 별도 행으로 노출
-            for loc, qty in sorted(locations.items()):
+            for loc, qty in row["locations_sorted"]:
                 entry_id = f"{row_id}::{loc}"
-                self._insert_audit_entry(tree, entry_id, row, loc, qty, insert_idx)
-                insert_idx += 1
+                entries.append(self._audit_entry(entry_id, row, loc, qty, len(entries)))
+
+        # 값은 미리 다 만들어 두고, 재고 목록과 같이 Tcl insert 명령을 바로 호출한다.
+        call = tree.tk.call
+        widget = tree._w
+        for entry_id, values, tags in entries:
+            call(widget, "insert", "", "end", "-id", entry_id, "-values", values, "-tags", tags)
+
+    def _audit_entry(
+        self, entry_id: str, row: Dict[str, object], location: str, current_qty: int, row_index: int
+    ) -> Tuple[str, Tuple, List[str]]:
+        """Return (iid, values, tags) for one audit row and register it in ``audit_entry_map``."""
 
-    def _insert_audit_entry(
-        self, tree: ttk.Treeview, entry_id: str, row: Dict[str, object], location: str, current_qty: int, row_index: int
-    ) -> None:
         counted = self.audit_counts.get(entry_id)
         status = "완료" if counted is not None else "대기"
         display_count = self._format_quantity(counted) if counted is not None else ""
@@ -2449,23 +3600,18 @@ class InventoryApp:
             if location
             else self._format_location_detail(row.get("locations", {}))
         )
-        tree.insert(
-            "",
-            tk.END,
-            iid=entry_id,
-            values=(
-                row.get("artist"),
-                row.get("item"),
-                row.get("option") or "-",
-                location_display,
-                label,
-                self._format_quantity(current_qty),
-                display_count,
-                status,
-            ),
-            tags=tags,
+        values = (
+            row.get("artist"),
+            row.get("item"),
+            row.get("option") or "-",
+            location_display,
+            label,
+            self._format_quantity(current_qty),
+            display_count,
+            status,
         )
         self.audit_entry_map[entry_id] = {"row_id": row.get("id"), "row": row, "location": location}
+        return entry_id, values, tags
 
     def _on_audit_select(self, event=None) -> None:
         selection = self.audit_tree.selection()
@@ -2480,11 +3626,11 @@ class InventoryApp:
         if not selection:
             messagebox.showinfo("안내", "실사 수량을 입력할 품목을 선택해 주세요.")
             return
-        try:
-            counted = int(self.audit_count_var.get().strip())
-        except ValueError:
+        counted_text = self.audit_count_var.get().strip()
+        if not _INT_RE.fullmatch(counted_text):
             messagebox.showerror("오류", "실사 수량은 0 이상의 정수로 입력해 주세요.")
             return
+        counted = int(counted_text)
         if counted < 0:
             messagebox.showerror("오류", "실사 수량은 음수가 될 수 없습니다.")
             return
@@ -2510,8 +3656,16 @@ class InventoryApp:
                 self.audit_tree.focus(selection[0])
                 self.audit_tree.selection_set(selection[0])
                 return
-        self.audit_counts[selection[0]] = counted
-        self._populate_audit_tree()
+        entry_id = selection[0]
+        self.audit_counts[entry_id] = counted
+        # 전체 목록을 다시 만들지 않고 입력한 행의 칸과 태그만 고친다.
+        tree = self.audit_tree
+        tree.set(entry_id, "counted", self._format_quantity(counted))
+        tree.set(entry_id, "status", "완료")
+        tags = list(tree.item(entry_id, "tags"))
+        if "audited" not in tags:
+            tags.append("audited")
+            tree.item(entry_id, tags=tags)
 
     def _reset_audit_counts(self) -> None:
         self.audit_counts = {}
@@ -2552,8 +3706,8 @@ class InventoryApp:
                 meta_artist = self.data.get("item_metadata", {}).get(row["item"], {}).get("artist") or "미분류"
             location_for_tx = location_scope or ""
             if not location_for_tx:
-                location_for_tx = sorted((row.get("locations") or {}).keys())[0:1]
-                location_for_tx = location_for_tx[0] if location_for_tx else "실사조정"
+                locations_sorted = row.get("locations_sorted", ())
+                location_for_tx = locations_sorted[0][0] if locations_sorted else "실사조정"
             tx = Transaction(
                 type="in" if delta > 0 else "out",
                 artist=meta_artist,
@@ -2576,15 +3730,13 @@ class InventoryApp:
         if adjustments or audit_updates:
             self._save_async()
             self.refresh_stock()
-            self.search_history("in", triggered_by_calendar=True)
-            self.search_history("out", triggered_by_calendar=True)
+            self._schedule_history_refresh(show="out")
             if adjustments:
                 self.set_status(f"실사 결과를 적용했습니다. 조정 {adjustments}건")
             else:
                 self.set_status("실사 시점을 업데이트했습니다.")
             self._log_user_action(
                 f"실사 결과 적용 - 조정 {adjustments}건, 실사 {len(self.audit_counts)}건",
-                persist=False,
             )
         else:
             self.set_status("실사 결과와 현재 재고가 동일합니다.")
@@ -2645,6 +3797,7 @@ class InventoryApp:
         if new_item != old_item:
             source_options = stock.pop(old_item, {})
 
+        invalidate_item_totals(self.data)
         target_options = stock.setdefault(new_item, {})
         for opt_key, locations in source_options.items():
             if new_item != old_item or opt_key != option_key_old:
@@ -2681,16 +3834,16 @@ class InventoryApp:
         self._save_async()
         self._refresh_artist_options()
         self.refresh_stock()
-        self.search_history("in", triggered_by_calendar=True)
-        self.search_history("out", triggered_by_calendar=True)
+        self._schedule_history_refresh(show="out")
         self.set_status("재고를 수정했습니다.")
         self._log_user_action(
             f"재고 수정 - {new_item} / {new_option or '-'} @ {new_location} {new_qty}개",
-            persist=False,
         )
 
     def export_stock(self) -> None:
-        if not self.stock_rows:
+        if self._stock_export_running:
+            return
+        if not self.stock_table:
             messagebox.showinfo("안내", "저장할 현재 재고가 없습니다.")
             return
         path = filedialog.asksaveasfilename(
@@ -2700,25 +3853,39 @@ class InventoryApp:
         )
         if not path:
             return
-        try:
-            per_location_rows: List[Tuple[str, str, str, str, str, int]] = []
-            for row in self.stock_row_lookup.values():
-                for loc, qty in sorted((row.get("locations") or {}).items()):
-                    per_location_rows.append(
-                        (
-                            self._category_label(row.get("category", "album")),
-                            row.get("artist"),
-                            row.get("item"),
-                            row.get("option"),
-                            loc,
-                            qty,
-                        )
+        per_location_rows: List[Tuple[str, str, str, str, str, int]] = []
+        for row in self.stock_row_lookup.values():
+            for loc, qty in row.get("locations_sorted", ()):
+                per_location_rows.append(
+                    (
+                        self._category_label(row.get("category", "album")),
+                        row.get("artist"),
+                        row.get("item"),
+                        row.get("option"),
+                        loc,
+                        qty,
                     )
-            export_stock_rows_to_xlsx(self.stock_rows, per_location_rows, path)
-        except RuntimeError as exc:
-            messagebox.showerror("오류", str(exc))
-            return
-        messagebox.showinfo("완료", f"현재 재고를 엑셀로 저장했습니다: {path}")
+                )
+
+        def _done(exc: Optional[Exception]) -> None:
+            self._stock_export_running = False
+            if self.export_stock_button.winfo_exists():
+                self.export_stock_button.state(["!disabled"])
+            if exc is not None:
+                self.set_status("엑셀 저장에 실패했습니다.", error=True)
+                messagebox.showerror("오류", str(exc))
+                return
+            self.set_status("현재 재고 엑셀 저장 완료")
+            messagebox.showinfo("완료", f"현재 재고를 엑셀로 저장했습니다: {path}")
+
+        # 재고 테이블은 새로고침 때 통째로 교체될 뿐 수정되지 않으므로 잠금 없이 작업 스레드와 공유한다.
+        self._stock_export_running = True
+        self.export_stock_button.state(["disabled"])
+        self.set_status("현재 재고를 엑셀로 저장하는 중...")
+        try:
+            export_stock_rows_to_xlsx_async(self.root, self.stock_table.rows(), tuple(per_location_rows), path, _done)
+        except Exception as exc:  # 작업 스레드를 띄우지 못하면 버튼과 플래그를 바로 되돌린다.
+            _done(exc)
 
     # ---------------------------------------------------------------- transactions
     def submit_transaction(self, tx_type: str) -> None:
@@ -2740,19 +3907,15 @@ class InventoryApp:
             tx_date = self._parse_day_input(record_day)
             now_time = datetime.now().time().replace(microsecond=0)
             timestamp = datetime.combine(tx_date, now_time)
-            artist = determine_artist(self.data, item, artist_input)
-            category = determine_category(self.data, item, category_input)
+            data = self.data
+            actor = self._current_actor()
+            artist = determine_artist(data, item, artist_input)
+            category = determine_category(data, item, category_input)
             allow_negative = False
             event_id = ""
             merge_index: Optional[int] = None
             if tx_type == "out":
-                option_key = option or ""
-                available = (
-                    self.data.get("stock", {})
-                    .get(item, {})
-                    .get(option_key, {})
-                    .get(location, 0)
-                )
+                available = data.get("stock", {}).get(item, {}).get(option or "", {}).get(location, 0)
                 if quantity > available:
                     proceed = messagebox.askyesno(
                         "확인",
@@ -2777,21 +3940,20 @@ class InventoryApp:
                 location=location,
                 quantity=quantity,
                 timestamp=timestamp,
-                actor=self._current_actor(),
+                actor=actor,
                 description=description,
                 event=event_mode,
                 event_id=event_id,
                 event_open=event_mode and tx_type == "out",
             )
-            record_transaction(self.data, tx, allow_negative=allow_negative)
+            record_transaction(data, tx, allow_negative=allow_negative)
             if event_mode and tx_type == "out" and merge_index is not None:
                 self._merge_event_out(merge_index, quantity)
             elif event_mode and tx_type == "in" and event_id:
                 self._close_event_out(event_id)
             self._save_async()
             self._log_user_action(
-                f"{self._current_actor()} {tx.type.upper()} - {item} / {option or '-'} @ {location} {quantity}개",
-                persist=False,
+                f"{actor} {tx.type.upper()} - {item} / {option or '-'} @ {location} {quantity}개",
             )
         except ValueError as exc:
             messagebox.showerror("오류", str(exc))
@@ -2800,8 +3962,7 @@ class InventoryApp:
         self.set_status("기록이 저장되었습니다.")
         self._refresh_artist_options()
         self.refresh_stock()
-        self.search_history("in", triggered_by_calendar=True)
-        self.search_history("out", triggered_by_calendar=True)
+        self._schedule_history_refresh(show="out")
         self.item_var.set("")
         self.option_var.set("")
         self.location_var.set("")
@@ -2810,9 +3971,7 @@ class InventoryApp:
         self.tx_date_var.set(date.today().isoformat())
 
     # ---------------------------------------------------------------- history
-    def search_history(
-        self, tx_type: str, triggered_by_calendar: bool = False, event_only: bool = False, event_open_only: bool = False
-    ) -> None:
+    def _history_search_params(self) -> Tuple[str, str, Optional[str]]:
         start_day_raw = self.history_start_var.get().strip() or None
         end_day_raw = self.history_end_var.get().strip() or None
         artist_value = self.history_artist_var.get().strip()
@@ -2820,6 +3979,21 @@ class InventoryApp:
         start_day, end_day = self._normalize_history_dates(start_day_raw, end_day_raw)
         self.history_start_var.set(start_day)
         self.history_end_var.set(end_day)
+        return start_day, end_day, artist
+
+    def _show_history(self, tx_type: str, start_day: str, end_day: str, event_only: bool = False) -> None:
+        self.current_history_type = tx_type
+        if event_only:
+            caption = "이벤트 출고(미해결)"
+        else:
+            caption = "입고 결과" if tx_type == "in" else "출고 결과"
+        self.history_caption.set(f"{caption} ({start_day} ~ {end_day})")
+        self._update_history_tree(self.history_cache[tx_type])
+
+    def search_history(
+        self, tx_type: str, triggered_by_calendar: bool = False, event_only: bool = False, event_open_only: bool = False
+    ) -> None:
+        start_day, end_day, artist = self._history_search_params()
         filtered, indices = self._filter_history_with_index(
             tx_type=tx_type,
             start_day=start_day,
@@ -2830,17 +4004,34 @@ class InventoryApp:
         )
         self.history_cache[tx_type] = filtered
         self.history_indices[tx_type] = indices
-        self.current_history_type = tx_type
         self.history_event_filter = bool(event_only and event_open_only)
-        if event_only:
-            caption = "이벤트 출고(미해결)"
-        else:
-            caption = "입고 결과" if tx_type == "in" else "출고 결과"
-        self.history_caption.set(f"{caption} ({start_day} ~ {end_day})")
-        self._update_history_tree(filtered)
+        self._show_history(tx_type, start_day, end_day, event_only)
         if not triggered_by_calendar:
             self.set_status(f"{('입고' if tx_type == 'in' else '출고')} 검색 결과 {len(filtered)}건")
 
+    def _schedule_history_refresh(self, show: str = "out") -> None:
+        """Coalesce history refreshes requested within _HISTORY_REFRESH_MS into one _search_history_both call."""
+
+        if self._history_refresh_job is not None:
+            self.root.after_cancel(self._history_refresh_job)
+        self._history_refresh_job = self.root.after(_HISTORY_REFRESH_MS, self._search_history_both, show)
+
+    def _search_history_both(self, show: str) -> None:
+        """Refresh the in and out history caches in one pass over the log, then display ``show``."""
+
+        if self._history_refresh_job is not None:
+            self.root.after_cancel(self._history_refresh_job)
+            self._history_refresh_job = None
+        start_day, end_day, artist = self._history_search_params()
+        buckets = self._filter_history_by_type(
+            tx_types=("in", "out"), start_day=start_day, end_day=end_day, artist=artist
+        )
+        for tx_type, (filtered, indices) in buckets.items():
+            self.history_cache[tx_type] = filtered
+            self.history_indices[tx_type] = indices
+        self.history_event_filter = False
+        self._show_history(show, start_day, end_day)
+
     def _refresh_current_history(self) -> None:
         if self.current_history_type == "out" and self.history_event_filter:
             self.search_history("out", event_only=True, event_open_only=True, triggered_by_calendar=True)
@@ -2857,14 +4048,33 @@ class InventoryApp:
         event_only: bool = False,
         event_open_only: bool = False,
     ) -> Tuple[List[Dict], List[int]]:
+        return self._filter_history_by_type(
+            tx_types=(tx_type,),
+            start_day=start_day,
+            end_day=end_day,
+            artist=artist,
+            event_only=event_only,
+            event_open_only=event_open_only,
+        )[tx_type]
+
+    def _filter_history_by_type(
+        self,
+        *,
+        tx_types: Tuple[str, ...],
+        start_day: Optional[str],
+        end_day: Optional[str],
+        artist: Optional[str],
+        event_only: bool = False,
+        event_open_only: bool = False,
+    ) -> Dict[str, Tuple[List[Dict], List[int]]]:
         start = datetime.fromisoformat(start_day).date() if start_day else None
         end = datetime.fromisoformat(end_day).date() if end_day else None
         # Preserve insertion order exactly as stored on disk
         history_entries = self.data.get("history", [])
-        results: List[Dict] = []
-        indices: List[int] = []
+        buckets: Dict[str, Tuple[List[Dict], List[int]]] = {tx_type: ([], []) for tx_type in tx_types}
         for idx, entry in enumerate(history_entries):
-            if entry.get("type") != tx_type:
+            bucket = buckets.get(entry.get("type"))
+            if bucket is None:
                 continue
             if event_only and not entry.get("event"):
                 continue
@@ -2884,9 +4094,9 @@ class InventoryApp:
                     continue
             if artist and entry.get("artist") != artist:
                 continue
-            results.append(entry)
-            indices.append(idx)
-        return results, indices
+            bucket[0].append(entry)
+            bucket[1].append(idx)
+        return buckets
 
     def _update_history_tree(self, entries: List[Dict]) -> None:
         tree = self.history_tree
@@ -2981,6 +4191,7 @@ class InventoryApp:
         if not history:
             return
         new_entry = history.pop()
+        invalidate_history_index(self.data)
         if target_index >= len(history):
             history.append(new_entry)
             return
@@ -3099,11 +4310,12 @@ class InventoryApp:
             update_stock(self.data, item, option, location, qty)
 
         history.pop(entry_index)
+        invalidate_history_index(self.data)
         self._save_async()
         self.refresh_stock()
         self._refresh_current_history()
         self.set_status("선택한 기록을 삭제했습니다.")
-        self._log_user_action("입/출고 기록 삭제", persist=False)
+        self._log_user_action("입/출고 기록 삭제")
 
     def clear_event_flag(self) -> None:
         selection = self.history_tree.selection()
@@ -3202,10 +4414,10 @@ class InventoryApp:
             update_stock(self.data, new_tx.item, new_tx.option, new_tx.location, new_tx.quantity)
 
         history[entry_index] = new_tx.to_dict()
+        invalidate_history_index(self.data)
         self._save_async()
         self._log_user_action(
             f"입/출고 기록 수정 - {new_tx.type.upper()} {new_tx.item} {new_tx.option or '-'} @{new_tx.location} {new_tx.quantity}개",
-            persist=False,
         )
 
     def export_history(self, tx_type: str) -> None:
@@ -3668,7 +4880,7 @@ class InventoryApp:
         self._save_now()
         self.reload_data()
         self.set_status("구글 드라이브 데이터를 반영했습니다.")
-        self._log_user_action("구글 시트 → Inventory Manager 동기화", persist=True)
+        self._log_user_action("구글 시트 → Inventory Manager 동기화")
 
     def upload_google_drive(self) -> None:
         """Settings-only: always push local data to Google Sheets."""
@@ -3693,7 +4905,7 @@ class InventoryApp:
             messagebox.showerror("오류", f"구글 시트 저장 실패: {exc}")
             return
         self.set_status("로컬 데이터를 구글 드라이브로 업로드했습니다.")
-        self._log_user_action("Inventory Manager → 구글 시트 동기화", persist=True)
+        self._log_user_action("Inventory Manager → 구글 시트 동기화")
 
     # ------------------------------------------------------------------ 잠금 및 설정
     def _start_idle_watch(self) -> None:
@@ -3959,7 +5171,8 @@ class InventoryApp:
         for col, title, width in headings:
             tree.heading(col, text=title)
             tree.column(col, width=width, anchor=tk.E if col in {"opening", "in_total", "out_total", "qty"} else tk.W)
-        for row in sorted(self.stock_rows, key=lambda r: (r[0], r[1], r[8])):
+        # 구분·아티스트·실사 열(0, 1, 8번째)로 정렬한다.
+        for row in sorted(self.stock_table.rows(), key=itemgetter(0, 1, 8)):
             tree.insert("", tk.END, values=row)
 
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)